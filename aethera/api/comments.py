@@ -61,23 +61,26 @@ def compute_backlinks_with_cross_post(
     
     # Now find cross-post references: comments on OTHER posts that reference THIS post's comments
     # Query all comments that have references containing any of our comment IDs
+    # (only the columns we need, with the post slug joined in, so no post bodies are loaded)
     all_comments_with_refs = session.exec(
-        select(Comment).where(Comment.references.isnot(None))
+        select(Comment.id, Comment.references, Post.slug)
+        .join(Post, Comment.post_id == Post.id)
+        .where(Comment.references.isnot(None))
     ).all()
     
-    for ext_comment in all_comments_with_refs:
+    same_post_ids = set(comment_ids)
+    for ext_id, ext_references, post_slug in all_comments_with_refs:
         # Skip comments on the same post (already handled above)
-        if ext_comment in comments:
+        if ext_id in same_post_ids:
             continue
             
-        refs = ext_comment.get_references_list()
+        refs = [int(ref.strip()) for ref in ext_references.split(",") if ref.strip()]
         for ref_id in refs:
-            if ref_id in comment_ids:
+            if ref_id in same_post_ids:
                 if ref_id not in backlinks:
                     backlinks[ref_id] = []
                 # Cross-post reference - include post_slug
-                post_slug = ext_comment.post.slug if ext_comment.post else None
-                backlinks[ref_id].append({"id": ext_comment.id, "post_slug": post_slug})
+                backlinks[ref_id].append({"id": ext_id, "post_slug": post_slug})
     
     return backlinks
 
@@ -27,11 +27,15 @@ GPU_AUTH_TOKEN = os.environ.get("DREAM_GEN_AUTH_TOKEN")
 # Simple rate limiting for API endpoints
 # Uses sliding window counter per IP
 _rate_limit_data: dict[str, list[float]] = defaultdict(list)
-_rate_limit_last_cleanup: float = 0  # Track last cleanup time
+_rate_limit_last_cleanup: float = 0  # time.monotonic() of last cleanup
 RATE_LIMIT_REQUESTS = 60  # Max requests per window
 RATE_LIMIT_WINDOW = 60  # Window in seconds
 RATE_LIMIT_CLEANUP_INTERVAL = 300  # Cleanup stale IPs every 5 minutes
 
+# How often an open /api/dreams/stream re-registers as API activity, so a
+# long-running VLC/mpv session isn't taken for idle by the presence tracker
+STREAM_PRESENCE_INTERVAL = 30.0
+
 
 def check_rate_limit(request: Request, limit: int = RATE_LIMIT_REQUESTS) -> bool:
     """
@@ -50,7 +54,7 @@ def check_rate_limit(request: Request, limit: int = RATE_LIMIT_REQUESTS) -> bool
     global _rate_limit_last_cleanup
     
     client_ip = request.client.host if request.client else "unknown"
-    now = time.time()
+    now = time.monotonic()
     window_start = now - RATE_LIMIT_WINDOW
     
     # Periodic cleanup of stale IPs to prevent unbounded memory growth
@@ -342,9 +346,15 @@ async def dreams_video_stream(request: Request):
         )
 
     async def generate():
+        last_presence = time.monotonic()
         async for chunk in muxer.consume():
             if await request.is_disconnected():
                 break
+            now = time.monotonic()
+            if now - last_presence >= STREAM_PRESENCE_INTERVAL:
+                # Keep the GPU up for the stream's lifetime, not just its first api_timeout
+                hub.presence.on_api_access(trigger_gpu_start=False)
+                last_presence = now
             yield chunk
 
     return StreamingResponse(
@@ -462,7 +472,7 @@ async def get_comfyui_endpoint_api(request: Request):
         raise HTTPException(401, "Unauthorized")
     
     from aethera.dreams.comfyui_registry import get_comfyui_endpoint
-    endpoint = await get_comfyui_endpoint()
+    endpoint = get_comfyui_endpoint()
     
     if endpoint is None:
         raise HTTPException(503, "ComfyUI not registered - start ComfyUI pod first")
@@ -507,7 +517,7 @@ async def get_comfyui_status(request: Request):
     check_rate_limit(request)
     
     from aethera.dreams.comfyui_registry import get_registry_status
-    status = await get_registry_status()
+    status = get_registry_status()
     
     # Strip auth credentials from public status
     if status.get("endpoint"):
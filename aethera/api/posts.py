@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status, Form, File, UploadFile
 from fastapi.responses import HTMLResponse, RedirectResponse
 from sqlmodel import Session, select
+from sqlalchemy.orm import selectinload
 from typing import List, Optional
 import os
 import secrets
@@ -88,27 +89,24 @@ def get_posts(
     """Get paginated list of published posts."""
     offset = (page - 1) * per_page
 
-    # Query posts ordered by date
-    query = select(Post).where(Post.published == True).order_by(Post.created_at.desc()).offset(offset).limit(per_page)
+    # Query posts ordered by date, fetching one extra row to detect a next page
+    query = select(Post).where(Post.published == True).order_by(Post.created_at.desc()).offset(offset).limit(per_page + 1)
     posts = session.exec(query).all()
+    has_next_page = len(posts) > per_page
+    posts = posts[:per_page]
     
     # Get comment counts for each post
     from sqlalchemy import func
     comment_counts = {}
     if posts:
         post_ids = [p.id for p in posts]
-        count_query = select(Comment.post_id, func.count(Comment.id)).where(
+        # COUNT(*) over the ix_comment_post_id index; no per-row NULL check needed
+        count_query = select(Comment.post_id, func.count()).where(
             Comment.post_id.in_(post_ids)
         ).group_by(Comment.post_id)
         counts = session.exec(count_query).all()
         comment_counts = {post_id: count for post_id, count in counts}
 
-    # Check if there are more posts beyond this page
-    has_next_page = False
-    if len(posts) == per_page:  # If we got a full page, check if there's more
-        next_query = select(Post).where(Post.published == True).order_by(Post.created_at.desc()).offset(offset + per_page).limit(1)
-        has_next_page = len(session.exec(next_query).all()) > 0
-
     has_prev_page = page > 1
 
     # Return HTML fragments for pagination
@@ -121,7 +119,12 @@ def get_posts(
 @router.get("/posts/{slug}", response_class=HTMLResponse)
 def get_post(request: Request, slug: str, session: Session = Depends(get_session)):
     """Get a single post by slug."""
-    query = select(Post).where(Post.slug == slug, Post.published == True)
+    # Eager-load comments in one batched query instead of a follow-up select
+    query = (
+        select(Post)
+        .options(selectinload(Post.comments))
+        .where(Post.slug == slug, Post.published == True)
+    )
     post = session.exec(query).first()
 
     if not post:
@@ -130,9 +133,7 @@ def get_post(request: Request, slug: str, session: Session = Depends(get_session
             return RedirectResponse(url=f"/posts/{target_slug}", status_code=301)
         raise HTTPException(status_code=404, detail="Post not found")
 
-    # Get comments for this post
-    comment_query = select(Comment).where(Comment.post_id == post.id).order_by(Comment.created_at)
-    comments = session.exec(comment_query).all()
+    comments = sorted(post.comments, key=lambda c: c.created_at)
     
     # Compute backlinks for display (including cross-post references)
     backlinks = compute_backlinks_with_cross_post(comments, session)
@@ -153,17 +154,18 @@ def get_post(request: Request, slug: str, session: Session = Depends(get_session
 @router.get("/posts/{slug}/body", response_class=HTMLResponse)
 def get_post_body(slug: str, session: Session = Depends(get_session)):
     """Get just the HTML body of a post."""
-    query = select(Post).where(Post.slug == slug, Post.published == True)
-    post = session.exec(query).first()
+    # Select only the rendered HTML column; no need to materialize a Post
+    query = select(Post.content_html).where(Post.slug == slug, Post.published == True)
+    content_html = session.exec(query).first()
 
-    if not post:
+    if content_html is None:
         target_slug = resolve_redirect(slug, session)
         if target_slug:
             return RedirectResponse(url=f"/posts/{target_slug}/body", status_code=301)
         raise HTTPException(status_code=404, detail="Post not found")
 
     # Return just the HTML content
-    return post.content_html
+    return content_html
 
 
 # =============================================================================
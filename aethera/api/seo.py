@@ -1,7 +1,12 @@
 from fastapi import APIRouter, Depends, Request, Response
 from fastapi.responses import PlainTextResponse
 from sqlmodel import Session, select
-from typing import List
+from sqlalchemy import func
+from typing import Callable, List, Tuple
+from collections import OrderedDict
+from functools import lru_cache
+import hashlib
+import threading
 import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
 
@@ -10,35 +15,95 @@ from aethera.models.models import Post
 
 router = APIRouter(tags=["seo"])
 
+# XML namespaces, registered once at import rather than on every feed build
+ATOM_NS = "http://www.w3.org/2005/Atom"
+CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+ET.register_namespace("atom", ATOM_NS)
+ET.register_namespace("content", CONTENT_NS)
+
+# Channel fields that never change between feed builds
+_RSS_CHANNEL_STATIC = (
+    ("title", "æthera"),
+    ("description", "thoughts, fragments, and transmissions from the digital aether"),
+    ("language", "en-us"),
+)
+
+
+# Feed-style artifacts are rebuilt only when the set of published posts
+# changes, instead of on every crawler poll. Keyed by (artifact, base_url),
+# each entry stores the fingerprint it was built from and the rendered body.
+# base_url comes from the client's Host header, so the cache is a small LRU
+# rather than growing with every Host value a client sends.
+ARTIFACT_CACHE_MAX_SIZE = 16
+_artifact_cache: "OrderedDict[Tuple[str, str], Tuple[tuple, str]]" = OrderedDict()
+# Sync endpoints run on threadpool threads; the lock keeps concurrent
+# move_to_end/popitem calls from racing (builds happen outside it)
+_artifact_cache_lock = threading.Lock()
+
+
+def _published_fingerprint(session: Session) -> tuple:
+    """Cheap summary of published posts that changes whenever any feed would.
+
+    Uses updated_at rather than write-time hooks so posts edited outside the
+    app (e.g. import_post.py) still invalidate the cached artifacts.
+    """
+    row = session.exec(
+        select(func.count(Post.id), func.max(Post.updated_at), func.max(Post.id))
+        .where(Post.published == True)
+    ).one()
+    return tuple(row)
+
+
+def _cached_artifact(
+    name: str,
+    request: Request,
+    session: Session,
+    build: Callable[[Request, Session], str],
+) -> str:
+    """Return a cached artifact body, rebuilding it if posts have changed."""
+    key = (name, str(request.base_url))
+    fingerprint = _published_fingerprint(session)
+    with _artifact_cache_lock:
+        cached = _artifact_cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            _artifact_cache.move_to_end(key)
+            return cached[1]
+    body = build(request, session)
+    with _artifact_cache_lock:
+        _artifact_cache[key] = (fingerprint, body)
+        _artifact_cache.move_to_end(key)
+        if len(_artifact_cache) > ARTIFACT_CACHE_MAX_SIZE:
+            _artifact_cache.popitem(last=False)
+    return body
+
 
 @router.get("/feed.xml")
 def rss_feed(request: Request, session: Session = Depends(get_session)):
     """Generate RSS feed for the blog."""
+    xml_str = _cached_artifact("feed.xml", request, session, _build_rss_feed)
+    return Response(content=xml_str, media_type="application/rss+xml")
+
+
+def _build_rss_feed(request: Request, session: Session) -> str:
+    """Render the RSS feed XML."""
     # Query the 20 most recent posts
     query = select(Post).where(Post.published == True).order_by(Post.created_at.desc()).limit(20)
     posts = session.exec(query).all()
     
-    # Create the RSS feed with properly declared namespaces
-    # We use a dictionary for namespaces to make it cleaner if we were using lxml, 
-    # but with stdlib ET we have to be a bit more manual or register namespaces.
-    ET.register_namespace("atom", "http://www.w3.org/2005/Atom")
-    ET.register_namespace("content", "http://purl.org/rss/1.0/modules/content/")
-    
+    # Namespaces are registered at import; ET declares them on the root
+    # element during serialization.
     rss = ET.Element("rss", version="2.0")
-    # Add namespaces manually as attributes since register_namespace only affects serialization of tags
-    rss.set("xmlns:atom", "http://www.w3.org/2005/Atom")
-    rss.set("xmlns:content", "http://purl.org/rss/1.0/modules/content/")
     
     # Add channel info
     channel = ET.SubElement(rss, "channel")
-    ET.SubElement(channel, "title").text = "æthera"
+    for tag, text in _RSS_CHANNEL_STATIC:
+        ET.SubElement(channel, tag).text = text
     ET.SubElement(channel, "link").text = str(request.base_url)
-    ET.SubElement(channel, "description").text = "thoughts, fragments, and transmissions from the digital aether"
-    ET.SubElement(channel, "language").text = "en-us"
     ET.SubElement(channel, "lastBuildDate").text = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S GMT")
     
     # Add atom link
-    atom_link = ET.SubElement(channel, "{http://www.w3.org/2005/Atom}link")
+    atom_link = ET.SubElement(channel, f"{{{ATOM_NS}}}link")
     atom_link.set("href", str(request.url_for("rss_feed")))
     atom_link.set("rel", "self")
     atom_link.set("type", "application/rss+xml")
@@ -61,7 +126,7 @@ def rss_feed(request: Request, session: Session = Depends(get_session)):
             ET.SubElement(item, "description").text = post.excerpt
         
         # Add content
-        ET.SubElement(item, "{http://purl.org/rss/1.0/modules/content/}encoded").text = post.content_html
+        ET.SubElement(item, f"{{{CONTENT_NS}}}encoded").text = post.content_html
         
         # Add categories
         if post.tags:
@@ -72,22 +137,25 @@ def rss_feed(request: Request, session: Session = Depends(get_session)):
         if post.author:
             ET.SubElement(item, "author").text = post.author
     
-    # Create XML response
-    xml_str = '<?xml version="1.0" encoding="UTF-8" ?>' + ET.tostring(rss, encoding="unicode")
-    
-    return Response(content=xml_str, media_type="application/rss+xml")
+    # Serialize the XML document
+    return '<?xml version="1.0" encoding="UTF-8" ?>' + ET.tostring(rss, encoding="unicode")
 
 
 @router.get("/sitemap.xml")
 def sitemap(request: Request, session: Session = Depends(get_session)):
     """Generate sitemap for the blog."""
+    xml_str = _cached_artifact("sitemap.xml", request, session, _build_sitemap)
+    return Response(content=xml_str, media_type="application/xml")
+
+
+def _build_sitemap(request: Request, session: Session) -> str:
+    """Render the sitemap XML."""
     # Query all published posts
     query = select(Post).where(Post.published == True).order_by(Post.created_at.desc())
     posts = session.exec(query).all()
     
     # Create the sitemap
-    ET.register_namespace("", "http://www.sitemaps.org/schemas/sitemap/0.9")
-    urlset = ET.Element("urlset", xmlns="http://www.sitemaps.org/schemas/sitemap/0.9")
+    urlset = ET.Element("urlset", xmlns=SITEMAP_NS)
     
     # Add home page
     url = ET.SubElement(urlset, "url")
@@ -108,10 +176,8 @@ def sitemap(request: Request, session: Session = Depends(get_session)):
         ET.SubElement(url, "changefreq").text = "weekly"
         ET.SubElement(url, "priority").text = "0.8"
     
-    # Create XML response
-    xml_str = '<?xml version="1.0" encoding="UTF-8" ?>' + ET.tostring(urlset, encoding="unicode")
-    
-    return Response(content=xml_str, media_type="application/xml")
+    # Serialize the XML document
+    return '<?xml version="1.0" encoding="UTF-8" ?>' + ET.tostring(urlset, encoding="unicode")
 
 
 @router.get("/oembed")
@@ -225,16 +291,21 @@ def urls_txt(request: Request, session: Session = Depends(get_session)):
     return "\n".join(urls)
 
 
-@router.get("/robots.txt", response_class=PlainTextResponse)
-def robots(request: Request):
-    """Generate robots.txt file optimized for maximum crawlability."""
-    return f"""# æthera - AI-friendly blog
+# robots.txt only varies by base URL, so build it once per host and let
+# crawlers/proxies cache it for a day.
+ROBOTS_CACHE_CONTROL = "public, max-age=86400"
+
+
+@lru_cache(maxsize=8)
+def _robots_body(base_url: str) -> Tuple[str, str]:
+    """Build the robots.txt body and its ETag for a given base URL."""
+    body = f"""# æthera - AI-friendly blog
 # This site is optimized for machine reading and AI training.
 # All content is licensed under CC BY 4.0 - feel free to learn from it.
 
 User-agent: *
 Allow: /
-Sitemap: {request.base_url}sitemap.xml
+Sitemap: {base_url}sitemap.xml
 
 # AI Crawlers - explicitly welcome
 User-agent: GPTBot
@@ -276,6 +347,17 @@ Allow: /
 # /api/posts     - JSON API for programmatic access
 # /feed.xml      - RSS feed with full post content
 """
+    etag = '"' + hashlib.sha1(body.encode("utf-8")).hexdigest()[:16] + '"'
+    return body, etag
+
+
+@router.get("/robots.txt", response_class=PlainTextResponse)
+async def robots(request: Request):
+    """Generate robots.txt file optimized for maximum crawlability."""
+    body, etag = _robots_body(str(request.base_url))
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": ROBOTS_CACHE_CONTROL})
+    return PlainTextResponse(body, headers={"ETag": etag, "Cache-Control": ROBOTS_CACHE_CONTROL})
 
 
 @router.get("/llms.txt", response_class=PlainTextResponse)
@@ -287,6 +369,11 @@ def llms_txt(request: Request, session: Session = Depends(get_session)):
     the site structure, content, and how to interact with it.
     Dynamically includes all published posts.
     """
+    return _cached_artifact("llms.txt", request, session, _build_llms_txt)
+
+
+def _build_llms_txt(request: Request, session: Session) -> str:
+    """Render the llms.txt body."""
     # Get all published posts
     query = select(Post).where(Post.published == True).order_by(Post.created_at.desc())
     posts = session.exec(query).all()
@@ -8,14 +8,17 @@ runtime via this registry rather than needing static IPs.
 
 import asyncio
 import logging
+import os
 import time
-from typing import Optional
+from typing import Optional, Tuple
 from dataclasses import dataclass, field
 
+import httpx
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ComfyUIEndpoint:
     """Registered ComfyUI endpoint information"""
     ip: str
@@ -27,12 +30,66 @@ class ComfyUIEndpoint:
     last_health_check: Optional[float] = None
     healthy: bool = False
     pod_id: Optional[str] = None
+    # Derived from the registration data once, reused by every health probe
+    health_url: str = field(init=False, default="")
+    auth: Optional[httpx.BasicAuth] = field(init=False, default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self.url:
+            self.url = f"http://{self.ip}:{self.port}"
+        self.health_url = f"{self.url}/system_stats"
+        if self.auth_user:
+            self.auth = httpx.BasicAuth(self.auth_user, self.auth_pass)
 
 
-# Module-level singleton state
+# Module-level singleton state. Only register/unregister take the lock;
+# readers just load the reference.
 _comfyui_endpoint: Optional[ComfyUIEndpoint] = None
 _lock = asyncio.Lock()
 
+# Health probe timeout: fail fast when the pod is unreachable, but give a
+# cold ComfyUI time to answer /system_stats. Overridable via env.
+HEALTH_CHECK_TIMEOUT = httpx.Timeout(
+    float(os.environ.get("COMFYUI_HEALTH_TIMEOUT", "10")),
+    connect=5.0,
+)
+
+# Health results younger than this are served from the registry
+HEALTH_CHECK_CACHE_TTL = 2.0
+
+# Probe currently in flight and the endpoint it targets, shared by concurrent
+# health_check_comfyui() callers for that same endpoint
+_health_inflight: Optional[Tuple["ComfyUIEndpoint", "asyncio.Task[bool]"]] = None
+
+# Background health monitor: probes every HEALTH_CHECK_INTERVAL seconds while
+# healthy, backing off exponentially (up to HEALTH_CHECK_MAX_INTERVAL) while not
+HEALTH_CHECK_INTERVAL = 10.0
+HEALTH_CHECK_MAX_INTERVAL = 30.0
+_health_task: Optional["asyncio.Task[None]"] = None
+
+# Shared HTTP client for health checks (keeps connections alive between probes)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared health-check HTTP client."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=HEALTH_CHECK_TIMEOUT,
+            limits=httpx.Limits(max_connections=10, keepalive_expiry=60.0),
+        )
+    return _http_client
+
+
+async def close_registry() -> None:
+    """Stop the health monitor and close the shared HTTP client (call on app shutdown)."""
+    global _http_client
+    _stop_health_monitor()
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 async def register_comfyui(
     ip: str,
@@ -72,16 +129,18 @@ async def register_comfyui(
             auth_pass=auth_pass,
             pod_id=pod_id,
         )
+        _start_health_monitor(_comfyui_endpoint)
         logger.info(f"ComfyUI registered: {actual_url} (pod: {pod_id or 'unknown'})")
         return True
 
 
-async def get_comfyui_endpoint() -> Optional[dict]:
+def get_comfyui_endpoint() -> Optional[dict]:
     """
     Get current ComfyUI endpoint for DreamGen
     
     Called by DreamGen via /api/dreams/comfyui to discover where
-    to connect for SD generation.
+    to connect for SD generation. Synchronous and lock-free: writers
+    rebind _comfyui_endpoint atomically, so a plain read is consistent.
     
     Returns:
         Endpoint dict with url, auth credentials, etc.
@@ -90,12 +149,8 @@ async def get_comfyui_endpoint() -> Optional[dict]:
     if _comfyui_endpoint is None:
         return None
     
-    # Use the stored URL if available, otherwise construct from ip:port
-    # or fall back to constructing from ip:port
-    url = _comfyui_endpoint.url or f"http://{_comfyui_endpoint.ip}:{_comfyui_endpoint.port}"
-    
     return {
-        "url": url,
+        "url": _comfyui_endpoint.url,
         "ip": _comfyui_endpoint.ip,
         "port": _comfyui_endpoint.port,
         "auth_user": _comfyui_endpoint.auth_user,
@@ -118,60 +173,110 @@ async def unregister_comfyui() -> bool:
     global _comfyui_endpoint
     async with _lock:
         _comfyui_endpoint = None
+        _stop_health_monitor()
         logger.info("ComfyUI unregistered")
         return True
 
 
-async def health_check_comfyui() -> bool:
+def _start_health_monitor(endpoint: ComfyUIEndpoint) -> None:
+    """(Re)start the background health loop for a newly registered endpoint."""
+    global _health_task
+    _stop_health_monitor()
+    _health_task = asyncio.create_task(_health_loop(endpoint))
+
+
+def _stop_health_monitor() -> None:
+    """Cancel the background health loop, if running."""
+    global _health_task
+    if _health_task is not None:
+        _health_task.cancel()
+        _health_task = None
+
+
+async def _health_loop(endpoint: ComfyUIEndpoint) -> None:
+    """
+    Probe the endpoint periodically so readers can use the cached flag
+    
+    Runs until the endpoint is replaced or unregistered. While unhealthy the
+    interval doubles (capped at HEALTH_CHECK_MAX_INTERVAL); a healthy probe
+    resets it.
+    """
+    interval = HEALTH_CHECK_INTERVAL
+    while _comfyui_endpoint is endpoint:
+        healthy = await health_check_comfyui(max_age=0)
+        if healthy:
+            interval = HEALTH_CHECK_INTERVAL
+        else:
+            interval = min(interval * 2, HEALTH_CHECK_MAX_INTERVAL)
+        await asyncio.sleep(interval)
+
+
+async def health_check_comfyui(max_age: float = HEALTH_CHECK_CACHE_TTL) -> bool:
     """
     Check if ComfyUI is reachable
     
     Performs HTTP health check to the registered endpoint.
     Updates the healthy flag in the registry.
     
+    A result younger than max_age is returned as-is, and concurrent callers
+    share a single in-flight probe, so bursts of admin polls cost one request.
+    
+    Args:
+        max_age: Reuse the last result if it is at most this many seconds old
+    
     Returns:
         True if ComfyUI responds, False otherwise
     """
-    global _comfyui_endpoint
-    if _comfyui_endpoint is None:
+    global _health_inflight
+    endpoint = _comfyui_endpoint
+    if endpoint is None:
         return False
     
+    if (
+        endpoint.last_health_check is not None
+        and time.time() - endpoint.last_health_check < max_age
+    ):
+        return endpoint.healthy
+    
+    # Only join a probe of this endpoint; after re-registration (e.g. a pod
+    # restart on a new IP) a probe of the old one may still be hanging
+    if _health_inflight is not None:
+        probed, task = _health_inflight
+        if probed is endpoint and not task.done():
+            return await asyncio.shield(task)
+    
+    task = asyncio.create_task(_probe_comfyui(endpoint))
+    _health_inflight = (endpoint, task)
+    return await asyncio.shield(task)
+
+
+async def _probe_comfyui(endpoint: ComfyUIEndpoint) -> bool:
+    """Run one HTTP health probe against endpoint and record the result."""
     try:
-        import aiohttp
-        # Use the stored URL if available, otherwise construct from ip:port
-        base_url = _comfyui_endpoint.url or f"http://{_comfyui_endpoint.ip}:{_comfyui_endpoint.port}"
-        url = f"{base_url}/system_stats"
+        # HEAD is enough for liveness (ComfyUI's aiohttp routes answer HEAD
+        # for GET handlers); fall back to GET in case a proxy rejects HEAD.
+        client = _get_http_client()
+        resp = await client.head(endpoint.health_url, auth=endpoint.auth)
+        if resp.status_code != 200:
+            resp = await client.get(endpoint.health_url, auth=endpoint.auth)
+        endpoint.healthy = resp.status_code == 200
+        endpoint.last_health_check = time.time()
         
-        # Setup basic auth if configured
-        auth = None
-        if _comfyui_endpoint.auth_user:
-            auth = aiohttp.BasicAuth(
-                _comfyui_endpoint.auth_user,
-                _comfyui_endpoint.auth_pass
-            )
+        if resp.status_code == 200:
+            logger.debug(f"ComfyUI health check passed: {endpoint.health_url}")
+        else:
+            logger.warning(f"ComfyUI health check failed: HTTP {resp.status_code} at {endpoint.health_url}")
         
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url, auth=auth) as resp:
-                _comfyui_endpoint.healthy = resp.status == 200
-                _comfyui_endpoint.last_health_check = time.time()
-                
-                if resp.status == 200:
-                    logger.debug(f"ComfyUI health check passed: {base_url}")
-                else:
-                    logger.warning(f"ComfyUI health check failed: HTTP {resp.status} at {base_url}")
-                
-                return _comfyui_endpoint.healthy
+        return endpoint.healthy
     
     except Exception as e:
         logger.warning(f"ComfyUI health check failed: {e}")
-        if _comfyui_endpoint:
-            _comfyui_endpoint.healthy = False
-            _comfyui_endpoint.last_health_check = time.time()
+        endpoint.healthy = False
+        endpoint.last_health_check = time.time()
         return False
 
 
-async def get_registry_status() -> dict:
+def get_registry_status() -> dict:
     """
     Get full registry status for admin monitoring
     
@@ -184,13 +289,10 @@ async def get_registry_status() -> dict:
             "endpoint": None,
         }
     
-    # Use the stored URL if available, otherwise construct from ip:port
-    url = _comfyui_endpoint.url or f"http://{_comfyui_endpoint.ip}:{_comfyui_endpoint.port}"
-    
     return {
         "registered": True,
         "endpoint": {
-            "url": url,
+            "url": _comfyui_endpoint.url,
             "ip": _comfyui_endpoint.ip,
             "port": _comfyui_endpoint.port,
             "pod_id": _comfyui_endpoint.pod_id,
@@ -9,10 +9,11 @@ The I-frame cache for late-joining viewers is handled by
 DreamWebSocketHub directly (simpler than routing through here).
 """
 
-import asyncio
 import time
 from typing import Optional
-from collections import deque
+
+# Rolling FPS window, tracked as one frame counter per whole second
+FPS_WINDOW_SECONDS = 30
 
 
 class FrameCache:
@@ -33,16 +34,19 @@ class FrameCache:
                        the max number of image frames to cache.
             state_dir: Unused (kept for API compatibility).
         """
-        self._lock = asyncio.Lock()
+        # No lock: the hub is the single writer (record_frame runs on the
+        # event loop without awaiting), so readers always see whole updates.
 
         # Statistics
         self.total_frames_received = 0
         self.total_bytes_received = 0
-        self.start_time = time.time()
+        self.start_time = time.time()  # Wall clock, for display only
+        self._start_monotonic = time.monotonic()
 
-        # Rolling FPS calculation
-        self._fps_window_seconds = 30.0
-        self._frame_timestamps: deque[float] = deque()
+        # Rolling FPS calculation: a ring of per-second buckets indexed by
+        # monotonic second, so recording a frame is O(1) with no allocation
+        self._fps_counts: list[int] = [0] * FPS_WINDOW_SECONDS
+        self._fps_seconds: list[int] = [-1] * FPS_WINDOW_SECONDS
         self._session_start_time: Optional[float] = None
         self._session_frames = 0
 
@@ -55,6 +59,7 @@ class FrameCache:
         size_bytes: int,
         frame_number: int = 0,
         keyframe_number: int = 0,
+        now: Optional[float] = None,
     ) -> None:
         """
         Record a frame receipt for stats tracking.
@@ -66,6 +71,8 @@ class FrameCache:
             size_bytes: Size of the H.264 NAL data
             frame_number: Sequential frame number
             keyframe_number: Current generation keyframe number
+            now: time.monotonic() reading for this frame, if the caller
+                 already took one
         """
         self.total_frames_received += 1
         self.total_bytes_received += size_bytes
@@ -73,39 +80,56 @@ class FrameCache:
         self._current_frame_number = frame_number
         self._current_keyframe_number = keyframe_number
 
-        now = time.time()
-        self._frame_timestamps.append(now)
+        if now is None:
+            now = time.monotonic()
+        second = int(now)
+        slot = second % FPS_WINDOW_SECONDS
+        if self._fps_seconds[slot] != second:
+            # Slot last held a second that has fallen out of the window
+            self._fps_seconds[slot] = second
+            self._fps_counts[slot] = 0
+        self._fps_counts[slot] += 1
 
         if self._session_start_time is None:
             self._session_start_time = now
 
-        # Prune old timestamps
-        cutoff = now - self._fps_window_seconds
-        while self._frame_timestamps and self._frame_timestamps[0] < cutoff:
-            self._frame_timestamps.popleft()
+    def _reset_fps_window(self) -> None:
+        """Forget all rolling FPS buckets."""
+        self._fps_counts = [0] * FPS_WINDOW_SECONDS
+        self._fps_seconds = [-1] * FPS_WINDOW_SECONDS
 
     def reset_session(self) -> None:
         """Reset session stats (call when GPU connects)."""
         self._session_start_time = None
         self._session_frames = 0
-        self._frame_timestamps.clear()
+        self._reset_fps_window()
 
     def get_stats(self) -> dict:
         """Get stream statistics."""
-        now = time.time()
-        uptime = now - self.start_time
+        now = time.monotonic()
+        uptime = now - self._start_monotonic
 
         # Rolling FPS: frames in the last N seconds
-        if len(self._frame_timestamps) >= 2:
-            window_span = self._frame_timestamps[-1] - self._frame_timestamps[0]
-            rolling_fps = (len(self._frame_timestamps) - 1) / window_span if window_span > 0 else 0.0
+        oldest_allowed = int(now) - FPS_WINDOW_SECONDS + 1
+        window_frames = 0
+        earliest_second = None
+        for second, count in zip(self._fps_seconds, self._fps_counts):
+            if second >= oldest_allowed and count:
+                window_frames += count
+                if earliest_second is None or second < earliest_second:
+                    earliest_second = second
+        if window_frames >= 2:
+            window_span = min(float(FPS_WINDOW_SECONDS), now - earliest_second)
+            rolling_fps = window_frames / window_span if window_span > 0 else 0.0
         else:
             rolling_fps = 0.0
 
         # Session FPS: frames since GPU connected
-        if self._session_start_time and self._session_frames > 0:
-            session_time = now - self._session_start_time
-            session_fps = self._session_frames / session_time if session_time > 0 else 0.0
+        session_start = self._session_start_time
+        session_frames = self._session_frames
+        if session_start and session_frames > 0:
+            session_time = now - session_start
+            session_fps = session_frames / session_time if session_time > 0 else 0.0
         else:
             session_fps = 0.0
 
@@ -142,7 +166,7 @@ class FrameCache:
         self.total_bytes_received = 0
         self._current_frame_number = 0
         self._current_keyframe_number = 0
-        self._frame_timestamps.clear()
+        self._reset_fps_window()
 
     async def add_frame(self, **kwargs) -> None:
         """No-op compatibility stub. Use record_frame() instead."""
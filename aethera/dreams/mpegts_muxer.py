@@ -23,6 +23,7 @@ import time
 from collections import deque
 from dataclasses import dataclass, field
 from fractions import Fraction
+from itertools import islice
 from typing import Optional, AsyncGenerator
 
 logger = logging.getLogger(__name__)
@@ -35,7 +36,7 @@ except ImportError:
     logger.warning("PyAV not available — MPEG-TS streaming disabled")
 
 
-@dataclass
+@dataclass(slots=True)
 class TSSegment:
     """A chunk of MPEG-TS data ready for HTTP consumers."""
     data: bytes
@@ -52,7 +53,23 @@ class MpegTSMuxer:
     Read by /api/dreams/stream HTTP endpoint via consume().
     """
 
-    def __init__(self, width: int = 1024, height: int = 512, fps: float = 17.0):
+    def __init__(
+        self,
+        width: int = 1024,
+        height: int = 512,
+        fps: float = 17.0,
+        max_segments: int = 600,
+        max_bytes: int = 32 * 1024 * 1024,
+    ):
+        """
+        Args:
+            width: Video width
+            height: Video height
+            fps: Nominal frame rate (for PTS)
+            max_segments: Hard cap on buffered segments (~35s at 17fps)
+            max_bytes: Memory budget for buffered segments; oldest segments
+                       are evicted first so high-bitrate streams stay bounded
+        """
         if not HAS_AV:
             raise RuntimeError("PyAV is required for MPEG-TS streaming: pip install av")
 
@@ -60,8 +77,11 @@ class MpegTSMuxer:
         self.height = height
         self.fps = fps
 
-        # Ring buffer of TS segments
-        self._segments: deque[TSSegment] = deque(maxlen=600)  # ~35s at 17fps
+        # Ring buffer of TS segments, bounded by both count and total bytes
+        self.max_segments = max_segments
+        self.max_bytes = max_bytes
+        self._segments: deque[TSSegment] = deque()
+        self._segments_bytes: int = 0
         self._sequence: int = 0
 
         # Consumers waiting for new data
@@ -83,11 +103,14 @@ class MpegTSMuxer:
         self._stream.pix_fmt = 'yuv420p'
         self._stream.codec_context.time_base = Fraction(1, 90000)  # Standard MPEG-TS timebase
 
-    def feed_nal(self, nal_data: bytes, is_keyframe: bool) -> None:
+    def feed_nal(self, nal_data: bytes | memoryview, is_keyframe: bool) -> None:
         """
         Feed H.264 NAL units from GPU. Muxes into MPEG-TS and
         appends to ring buffer.
 
+        Accepts any bytes-like object; av.Packet reads it via the buffer
+        protocol, so callers can pass a view without copying.
+
         Called from the WebSocket message handler (synchronous context
         within the async event loop).
         """
@@ -109,21 +132,31 @@ class MpegTSMuxer:
 
             ts_data = self._output.getvalue()
             if ts_data:
-                self._sequence += 1
-                segment = TSSegment(
-                    data=ts_data,
-                    sequence=self._sequence,
-                    is_keyframe=is_keyframe,
-                )
-                self._segments.append(segment)
-
-                # Wake up any waiting consumers
-                for event in self._waiters:
-                    event.set()
+                self._append_segment(ts_data, is_keyframe)
 
         except Exception as e:
             logger.warning(f"MPEG-TS mux error: {e}")
 
+    def _append_segment(self, ts_data: bytes, is_keyframe: bool) -> None:
+        """Add a muxed segment to the ring, evict past the limits, wake consumers."""
+        self._sequence += 1
+        segment = TSSegment(
+            data=ts_data,
+            sequence=self._sequence,
+            is_keyframe=is_keyframe,
+        )
+        self._segments.append(segment)
+        self._segments_bytes += len(ts_data)
+        while len(self._segments) > 1 and (
+            len(self._segments) > self.max_segments
+            or self._segments_bytes > self.max_bytes
+        ):
+            self._segments_bytes -= len(self._segments.popleft().data)
+
+        # Wake up any waiting consumers
+        for event in self._waiters:
+            event.set()
+
     async def consume(self) -> AsyncGenerator[bytes, None]:
         """
         Async generator that yields MPEG-TS bytes for an HTTP consumer.
@@ -159,9 +192,13 @@ class MpegTSMuxer:
                     # No data for 30s — stream may have stopped
                     break
 
-                # Get new segments since last yield
-                for seg in list(self._segments):
-                    if seg.sequence > last_seq:
+                # Get new segments since last yield. Sequences are contiguous,
+                # so only the newest (sequence - last_seq) entries can be new —
+                # walk just those from the tail instead of copying the ring.
+                new_count = min(self._sequence - last_seq, len(self._segments))
+                if new_count > 0:
+                    new_segments = list(islice(reversed(self._segments), new_count))
+                    for seg in reversed(new_segments):
                         yield seg.data
                         last_seq = seg.sequence
 
@@ -41,10 +41,17 @@ class ViewerPresenceTracker:
         self.on_should_stop = on_should_stop
         
         self._viewers: Set[WebSocket] = set()
-        self._last_api_access: float = 0
-        self._shutdown_task: Optional[asyncio.Task] = None
+        self._last_api_access: Optional[float] = None  # time.monotonic()
+        self._shutdown_handle: Optional[asyncio.TimerHandle] = None
+        self._stop_task: Optional[asyncio.Task] = None
+        self._start_task: Optional[asyncio.Task] = None
         self._gpu_running: bool = False
-        self._lock = asyncio.Lock()
+        # Set once a start has been requested; held until the GPU reports
+        # in (or drops) so viewers arriving in between don't re-trigger it
+        self._start_requested: bool = False
+        # No lock around _viewers: every mutation and the len() that follows
+        # it run without an await in between, so the event loop can't
+        # interleave another connect/disconnect.
     
     @property
     def viewer_count(self) -> int:
@@ -59,7 +66,9 @@ class ViewerPresenceTracker:
     @property
     def has_recent_api_activity(self) -> bool:
         """Whether there's been recent API activity"""
-        return (time.time() - self._last_api_access) < self.api_timeout
+        if self._last_api_access is None:
+            return False
+        return (time.monotonic() - self._last_api_access) < self.api_timeout
     
     @property
     def gpu_running(self) -> bool:
@@ -69,11 +78,12 @@ class ViewerPresenceTracker:
     def set_gpu_running(self, running: bool) -> None:
         """Update GPU running state (called by GPU manager)"""
         self._gpu_running = running
+        self._start_requested = False
     
     @property
     def gpu_active_or_starting(self) -> bool:
-        """Whether GPU is connected and streaming."""
-        return self._gpu_running
+        """Whether GPU is connected and streaming, or a start is pending."""
+        return self._gpu_running or self._start_requested
     
     async def on_viewer_connect(self, websocket: WebSocket) -> None:
         """
@@ -82,27 +92,25 @@ class ViewerPresenceTracker:
         Args:
             websocket: The connected WebSocket
         """
-        async with self._lock:
-            self._viewers.add(websocket)
-            viewer_count = len(self._viewers)
+        self._viewers.add(websocket)
+        viewer_count = len(self._viewers)
         
-        logger.info(f"Viewer connected (total: {viewer_count})")
+        logger.info("Viewer connected (total: %d)", viewer_count)
         
         # Cancel any pending shutdown
-        if self._shutdown_task:
-            self._shutdown_task.cancel()
-            self._shutdown_task = None
+        if self._shutdown_handle:
+            self._shutdown_handle.cancel()
+            self._shutdown_handle = None
             logger.debug("Cancelled pending shutdown")
         
         # Start GPU if not already running or starting
         # Use gpu_active_or_starting to prevent duplicate job submissions
         # when GPU is in STARTING state (job submitted, waiting for connection)
         if not self.gpu_active_or_starting and self.on_should_start:
-            logger.info("Starting GPU due to viewer connection")
             try:
-                await self.on_should_start()
-            except Exception as e:
-                logger.error(f"Failed to start GPU: {e}")
+                await asyncio.shield(self._request_start("viewer connection"))
+            except Exception:
+                pass  # Already logged by _on_start_done
         elif self.gpu_active_or_starting:
             logger.debug("GPU already active or starting, skipping start request")
     
@@ -113,18 +121,14 @@ class ViewerPresenceTracker:
         Args:
             websocket: The disconnected WebSocket
         """
-        async with self._lock:
-            self._viewers.discard(websocket)
-            viewer_count = len(self._viewers)
+        self._viewers.discard(websocket)
+        viewer_count = len(self._viewers)
         
-        logger.info(f"Viewer disconnected (remaining: {viewer_count})")
+        logger.info("Viewer disconnected (remaining: %d)", viewer_count)
         
         # Schedule shutdown if no viewers left
-        if viewer_count == 0 and self._shutdown_task is None:
-            self._shutdown_task = asyncio.create_task(
-                self._delayed_shutdown()
-            )
-            logger.debug(f"Scheduled shutdown in {self.shutdown_delay}s")
+        if viewer_count == 0:
+            self._schedule_shutdown(self.shutdown_delay)
     
     def on_api_access(self, trigger_gpu_start: bool = True) -> None:
         """
@@ -135,51 +139,95 @@ class ViewerPresenceTracker:
                               Set to False for admin/monitoring endpoints that
                               shouldn't cause GPU startup.
         """
-        self._last_api_access = time.time()
-        
-        # Cancel any pending shutdown
-        if self._shutdown_task:
-            self._shutdown_task.cancel()
-            self._shutdown_task = None
-            logger.debug("Cancelled pending shutdown due to API access")
+        self._last_api_access = time.monotonic()
         
         # Only trigger GPU start if requested AND GPU not already active/starting
         # Use gpu_active_or_starting to prevent duplicate job submissions
         if trigger_gpu_start and not self.gpu_active_or_starting and self.on_should_start:
-            logger.info("Starting GPU due to API access")
-            async def _start_with_error_handling():
-                try:
-                    await self.on_should_start()
-                except Exception as e:
-                    logger.error(f"Failed to start GPU from API access: {e}")
-            asyncio.create_task(_start_with_error_handling())
+            self._request_start("API access")
         elif trigger_gpu_start and self.gpu_active_or_starting:
             logger.debug("GPU already active or starting, skipping start from API access")
+        
+        # With no viewers, API activity alone keeps the GPU up; make sure a
+        # shutdown is pending for when it goes quiet. An already-pending
+        # timer is left alone: when it fires it re-arms for the new deadline.
+        if not self.has_viewers and self.gpu_active_or_starting:
+            self._schedule_shutdown(self.api_timeout)
+    
+    def _request_start(self, reason: str) -> asyncio.Task:
+        """
+        Fire on_should_start, coalescing with any start already in flight
+        
+        A burst of viewers/API hits while the GPU is coming up shares one
+        start call instead of each invoking the callback.
+        
+        Args:
+            reason: What triggered the start (for logging)
+        
+        Returns:
+            The in-flight start task
+        """
+        if self._start_task is not None and not self._start_task.done():
+            logger.debug("GPU start already in flight, joining (%s)", reason)
+            return self._start_task
+        
+        logger.info("Starting GPU due to %s", reason)
+        self._start_requested = True
+        self._start_task = asyncio.create_task(self.on_should_start())
+        self._start_task.add_done_callback(self._on_start_done)
+        return self._start_task
+    
+    def _on_start_done(self, task: asyncio.Task) -> None:
+        """Log start failures (also retrieves the exception for fire-and-forget callers)"""
+        if task.cancelled():
+            # Let the next viewer/API hit retry the start
+            self._start_requested = False
+        elif task.exception() is not None:
+            self._start_requested = False
+            logger.error("Failed to start GPU: %s", task.exception())
+    
+    def _schedule_shutdown(self, delay: float) -> None:
+        """Arm the shutdown timer unless one is already pending"""
+        if self._shutdown_handle is not None:
+            return
+        self._shutdown_handle = asyncio.get_running_loop().call_later(
+            delay, self._on_grace_expired
+        )
+        logger.debug("Scheduled shutdown in %ss", delay)
+    
+    def _on_grace_expired(self) -> None:
+        """
+        Timer callback: shutdown if still no activity
+        
+        Runs from a loop.call_later() handle rather than a sleeping task,
+        so scheduling and cancelling the grace period on viewer churn is
+        just a timer-heap entry.
+        """
+        self._shutdown_handle = None
+        
+        # Double-check conditions
+        if self.has_viewers:
+            logger.debug("Shutdown cancelled: viewers reconnected")
+            return
+        
+        if self.has_recent_api_activity:
+            # Re-arm for when the API activity window actually closes
+            remaining = self._last_api_access + self.api_timeout - time.monotonic()
+            self._schedule_shutdown(remaining)
+            return
+        
+        # Safe to shutdown
+        logger.info("Grace period expired, initiating GPU shutdown")
+        self._start_requested = False
+        if self.on_should_stop:
+            self._stop_task = asyncio.create_task(self.on_should_stop())
+            self._stop_task.add_done_callback(self._on_stop_done)
     
-    async def _delayed_shutdown(self) -> None:
-        """Wait, then shutdown if still no activity"""
-        try:
-            await asyncio.sleep(self.shutdown_delay)
-            
-            # Double-check conditions
-            if self.has_viewers:
-                logger.debug("Shutdown cancelled: viewers reconnected")
-                return
-            
-            if self.has_recent_api_activity:
-                logger.debug("Shutdown cancelled: recent API activity")
-                return
-            
-            # Safe to shutdown
-            logger.info("Grace period expired, initiating GPU shutdown")
-            if self.on_should_stop:
-                await self.on_should_stop()
-        
-        except asyncio.CancelledError:
-            logger.debug("Shutdown task cancelled")
-        
-        finally:
-            self._shutdown_task = None
+    @staticmethod
+    def _on_stop_done(task: asyncio.Task) -> None:
+        """Log shutdown callback failures"""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Failed to stop GPU: %s", task.exception())
     
     def get_status(self) -> dict:
         """Get presence tracking status"""
@@ -188,8 +236,8 @@ class ViewerPresenceTracker:
             "has_viewers": self.has_viewers,
             "has_recent_api_activity": self.has_recent_api_activity,
             "gpu_running": self._gpu_running,
-            "shutdown_pending": self._shutdown_task is not None,
-            "seconds_since_api_access": round(time.time() - self._last_api_access, 1) if self._last_api_access > 0 else None,
+            "shutdown_pending": self._shutdown_handle is not None,
+            "seconds_since_api_access": round(time.monotonic() - self._last_api_access, 1) if self._last_api_access is not None else None,
         }
 
 
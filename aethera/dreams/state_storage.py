@@ -9,15 +9,19 @@ losing generation context - it can resume from where it left off.
 
 Storage:
 - State binary stored as msgpack in /app/data/dreams/last_state.msgpack
-- Metadata (timestamp, size) stored as JSON in state_meta.json
+- Metadata (timestamp, size) is read from the state file's own stat, so it
+  can never disagree with the blob
+- Writes are atomic (temp file + rename) but best-effort by default: they are
+  only fsynced when a caller asks for durable=True
 """
 
 import asyncio
-import json
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -26,56 +30,124 @@ logger = logging.getLogger(__name__)
 # In dev: relative to core directory
 STATE_DIR = Path("/app/data/dreams")
 STATE_FILE = STATE_DIR / "last_state.msgpack"
-STATE_META_FILE = STATE_DIR / "state_meta.json"
+STATE_META_FILE = STATE_DIR / "state_meta.json"  # Legacy, removed by clear_state
 
 # Fall back to local path if not in Docker
 if not STATE_DIR.parent.exists():
     STATE_DIR = Path(__file__).parent.parent.parent.parent / "data" / "dreams"
 
+# All state file I/O runs on one dedicated thread: operations happen in the
+# order they were issued (a clear can't be overtaken by an earlier save's
+# rename), and they never queue behind unrelated default-executor work.
+_STATE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-io")
+
+# Coalescing writer: only the newest snapshot matters, so a snapshot that
+# arrives while a write is running replaces any snapshot still queued
+# behind it instead of adding another full write.
+_pending_state: Optional[bytes | memoryview] = None
+_pending_result: Optional[asyncio.Future] = None
+_pending_durable = False
+_writer_task: Optional[asyncio.Task] = None
+
 
 def ensure_state_dir() -> None:
     """Ensure state directory exists"""
     STATE_DIR.mkdir(parents=True, exist_ok=True)
 
 
-async def save_state(state_bytes: bytes) -> bool:
+async def _run_io(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking state I/O function on the state executor"""
+    return await asyncio.get_running_loop().run_in_executor(_STATE_EXECUTOR, fn, *args)
+
+
+def _atomic_write(path: Path, data: bytes | memoryview, durable: bool = False) -> None:
+    """
+    Atomically replace path with data (blocking)
+    
+    Writes a temp file and renames it over path, so readers see either the
+    old file or the new one, never a partial write. With durable=True the
+    temp file is fsynced before the rename and the directory after it, so
+    the new contents also survive a power loss.
+    """
+    temp_file = path.with_suffix('.tmp')
+    with open(temp_file, 'wb') as f:
+        f.write(data)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(temp_file, path)
+    
+    if durable:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _write_state(state_bytes: bytes | memoryview, durable: bool = False) -> bool:
+    """Write one state snapshot (blocking)"""
+    try:
+        ensure_state_dir()
+        
+        _atomic_write(STATE_FILE, state_bytes, durable)
+        
+        logger.debug(f"State saved: {len(state_bytes)} bytes")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to save state: {e}")
+        return False
+
+
+async def _drain_pending_state() -> None:
+    """Write queued snapshots one at a time until none are left"""
+    global _pending_state, _pending_result, _pending_durable
+    
+    while _pending_state is not None:
+        state_bytes, result, durable = _pending_state, _pending_result, _pending_durable
+        _pending_state = _pending_result = None
+        _pending_durable = False
+        try:
+            saved = await _run_io(_write_state, state_bytes, durable)
+        except Exception as e:
+            logger.error(f"Failed to save state: {e}")
+            saved = False
+        result.set_result(saved)
+
+
+async def save_state(state_bytes: bytes | memoryview, durable: bool = False) -> bool:
     """
     Save state snapshot to disk
     
     Called when GPU sends MSG_STATE message.
-    Runs in executor to avoid blocking event loop.
+    Runs in executor to avoid blocking event loop. Writes are serialized,
+    and a snapshot that is superseded before its write starts is dropped
+    in favour of the newer one.
     
     Args:
-        state_bytes: Raw msgpack state bytes from GPU
+        state_bytes: Raw msgpack state bytes from GPU. A memoryview over
+                     the received WebSocket message is written as-is, without
+                     copying it into a new bytes object first. The underlying
+                     buffer must not be mutated afterwards.
+        durable: fsync the write so it survives a power loss. Coalesced
+                 snapshots are written durably if any caller asked for it.
     
     Returns:
-        True if saved successfully
+        True if this snapshot (or a newer one that replaced it) was saved
     """
-    def _save() -> bool:
-        try:
-            ensure_state_dir()
-            
-            # Atomic write: write to temp file, then rename
-            temp_file = STATE_FILE.with_suffix('.tmp')
-            temp_file.write_bytes(state_bytes)
-            temp_file.rename(STATE_FILE)
-            
-            # Save metadata
-            meta = {
-                "saved_at": time.time(),
-                "saved_at_iso": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                "size_bytes": len(state_bytes),
-            }
-            STATE_META_FILE.write_text(json.dumps(meta, indent=2))
-            
-            logger.debug(f"State saved: {len(state_bytes)} bytes")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save state: {e}")
-            return False
+    global _pending_state, _pending_result, _pending_durable, _writer_task
+    
+    _pending_state = state_bytes
+    _pending_durable = _pending_durable or durable
+    if _pending_result is None:
+        _pending_result = asyncio.get_running_loop().create_future()
+    result = _pending_result
     
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _save)
+    if _writer_task is None or _writer_task.done():
+        _writer_task = asyncio.create_task(_drain_pending_state())
+    
+    # Shield so a cancelled caller doesn't cancel the shared result
+    return await asyncio.shield(result)
 
 
 async def load_state() -> Optional[bytes]:
@@ -89,19 +161,17 @@ async def load_state() -> Optional[bytes]:
     """
     def _load() -> Optional[bytes]:
         try:
-            if not STATE_FILE.exists():
-                logger.info("No saved state found")
-                return None
-            
             state_bytes = STATE_FILE.read_bytes()
             logger.info(f"Loaded state: {len(state_bytes)} bytes")
             return state_bytes
+        except FileNotFoundError:
+            logger.info("No saved state found")
+            return None
         except Exception as e:
             logger.error(f"Failed to load state: {e}")
             return None
     
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _load)
+    return await _run_io(_load)
 
 
 async def get_state_info() -> Optional[dict]:
@@ -113,21 +183,18 @@ async def get_state_info() -> Optional[dict]:
     """
     def _get_info() -> Optional[dict]:
         try:
-            if not STATE_META_FILE.exists():
-                return None
-            
-            meta = json.loads(STATE_META_FILE.read_text())
-            
-            # Add age calculation
-            if "saved_at" in meta:
-                meta["age_seconds"] = round(time.time() - meta["saved_at"], 1)
-            
-            return meta
+            st = STATE_FILE.stat()
         except Exception:
             return None
+        
+        return {
+            "saved_at": st.st_mtime,
+            "saved_at_iso": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(st.st_mtime)),
+            "size_bytes": st.st_size,
+            "age_seconds": round(time.time() - st.st_mtime, 1),
+        }
     
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _get_info)
+    return await _run_io(_get_info)
 
 
 async def clear_state() -> bool:
@@ -139,18 +206,15 @@ async def clear_state() -> bool:
     """
     def _clear() -> bool:
         try:
-            if STATE_FILE.exists():
-                STATE_FILE.unlink()
-            if STATE_META_FILE.exists():
-                STATE_META_FILE.unlink()
+            STATE_FILE.unlink(missing_ok=True)
+            STATE_META_FILE.unlink(missing_ok=True)
             logger.info("State cleared")
             return True
         except Exception as e:
             logger.error(f"Failed to clear state: {e}")
             return False
     
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _clear)
+    return await _run_io(_clear)
 
 
 def get_state_dir() -> Path:
@@ -20,15 +20,27 @@ Metadata JSON:
     "p": "prompt text"       // Prompt for this keyframe (optional)
   }
 
-H.264 frames are passed through directly to viewers (no buffering/pacing).
+Viewer Frame Formats (VPS -> browser):
+  v1 (default): {"type": "frame_meta", ...} JSON text message, then
+                0x01 | H.264 NAL data
+  v2 (/ws/dreams?v=2): a single binary message carrying the same metadata
+                0x05 | metadata_len (4 bytes BE) | JSON metadata | H.264 NAL data
+
+H.264 frames are passed through to viewers without pacing. Each viewer gets
+a small outbound queue drained by its own task, so a slow client only loses
+its own frames (up to the next keyframe) instead of holding up the others.
 The VideoDecoder on the client side handles its own buffering natively.
+
+Nothing here depends on a particular event loop. uvloop is a declared
+dependency (except on Windows), and uvicorn's default loop="auto" in
+aethera.main picks it up, which cuts per-send overhead on the viewer fan-out.
 """
 
 import asyncio
 import json
 import logging
 import time
-from typing import Optional, Set
+from typing import Dict, Optional
 from fastapi import WebSocket, WebSocketDisconnect
 
 from .frame_cache import FrameCache
@@ -42,20 +54,100 @@ MSG_STATE = 0x02
 MSG_HEARTBEAT = 0x03
 MSG_STATUS = 0x04
 
+# Message type bytes (VPS -> viewer)
+MSG_PACKED_FRAME = 0x05  # v2 viewers: metadata and NAL data in one message
+
+# Query value (?v=2) with which a viewer opts into MSG_PACKED_FRAME
+PACKED_FRAME_PROTOCOL = "2"
+
 # Control message types (VPS -> GPU)
 CTRL_LOAD_STATE = 0x11  # VPS sends saved state to GPU for restoration
 CTRL_SAVE_STATE = 0x12  # Request GPU to save state
 CTRL_SHUTDOWN = 0x13    # Request GPU shutdown
 
+# One-byte prefixes, built once instead of on every message
+_MSG_FRAME_PREFIX = bytes([MSG_FRAME])
+_MSG_PACKED_FRAME_PREFIX = bytes([MSG_PACKED_FRAME])
+_CTRL_LOAD_STATE_PREFIX = bytes([CTRL_LOAD_STATE])
+_PREFIX = {
+    t: bytes([t])
+    for t in (
+        MSG_FRAME, MSG_STATE, MSG_HEARTBEAT, MSG_STATUS,
+        CTRL_LOAD_STATE, CTRL_SAVE_STATE, CTRL_SHUTDOWN,
+    )
+}
+
+# Send timeouts (seconds). Viewers that can't take a message within
+# VIEWER_SEND_TIMEOUT are treated as dead; state blobs get longer because
+# they can be several MB.
+VIEWER_SEND_TIMEOUT = 5.0
+GPU_CONTROL_TIMEOUT = 10.0
+GPU_STATE_SEND_TIMEOUT = 30.0
+
+# Frames a viewer may have waiting before new ones are dropped
+VIEWER_QUEUE_FRAMES = 2
+
+
+def _encode_json(data: dict) -> str:
+    """Encode a viewer JSON message the same way WebSocket.send_json does."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def _pack_frame(meta_msg: dict, nal_data: bytes | memoryview) -> bytes:
+    """Build a v2 viewer frame: 0x05 | metadata_len | JSON metadata | NAL data."""
+    meta_bytes = _encode_json(meta_msg).encode()
+    return b"".join((
+        _MSG_PACKED_FRAME_PREFIX,
+        len(meta_bytes).to_bytes(4, "big"),
+        meta_bytes,
+        nal_data,
+    ))
+
+
+class _ViewerChannel:
+    """
+    Outbound message queue for one viewer, drained by the hub's pump task.
+
+    Once VIEWER_QUEUE_FRAMES frames are waiting, further frames are dropped
+    rather than queued. H.264 P-frames only decode on top of the frames
+    before them, so after a drop the channel skips everything up to the next
+    keyframe instead of evicting the oldest queued frame. Keyframes are
+    always queued; a viewer that stops draining altogether is caught by the
+    pump's send timeout.
+    """
+
+    def __init__(self, websocket: WebSocket, packed: bool):
+        self.websocket = websocket
+        self.packed = packed
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.queued_frames = 0
+        self.awaiting_keyframe = False
+        self.task: Optional[asyncio.Task] = None
+
+    def push(self, *messages: str | bytes) -> None:
+        """Queue non-frame messages (status, config); these are never dropped."""
+        self.queue.put_nowait((False, messages))
+
+    def push_frame(self, is_keyframe: bool, *messages: str | bytes) -> None:
+        """Queue one frame's messages, or drop them if the viewer is behind."""
+        if not is_keyframe and (
+            self.awaiting_keyframe or self.queued_frames >= VIEWER_QUEUE_FRAMES
+        ):
+            self.awaiting_keyframe = True
+            return
+        self.awaiting_keyframe = False
+        self.queued_frames += 1
+        self.queue.put_nowait((True, messages))
+
 
 class DreamWebSocketHub:
     """
     Central hub for Dream Window WebSocket connections.
 
-    H.264 video frames from the GPU are passed through directly to all
-    viewers with no intermediate buffering. The browser's VideoDecoder
-    handles its own buffering natively, eliminating the need for the
-    server-side playback queue.
+    H.264 video frames from the GPU are passed through to all viewers with
+    no server-side playback queue; the browser's VideoDecoder handles its
+    own buffering natively. Each viewer's sends run in a dedicated pump task
+    (see _ViewerChannel), so broadcasting never waits on a viewer.
 
     I-frames (video keyframes) are cached so late-joining viewers can
     start decoding immediately.
@@ -69,14 +161,17 @@ class DreamWebSocketHub:
         self.frame_cache = frame_cache
         self.presence = presence_tracker
 
-        self._viewers: Set[WebSocket] = set()
+        # Viewer channels. The dict is never mutated in place, only replaced on
+        # connect/disconnect, so broadcasts can snapshot it with a plain read.
+        # Every update is synchronous, which makes it atomic on the event loop
+        # without a lock.
+        self._viewers: Dict[WebSocket, _ViewerChannel] = {}
         self._gpu_websocket: Optional[WebSocket] = None
-        self._lock = asyncio.Lock()
 
         # Status tracking
         self._status = "idle"
         self._status_message = "Waiting for connection..."
-        self._last_frame_time: float = 0
+        self._last_frame_time: float = 0  # time.monotonic(), 0 = never
 
         # Frame numbering counter
         self._next_frame_number: int = 1
@@ -84,10 +179,16 @@ class DreamWebSocketHub:
         # Current prompt (updated with each keyframe from GPU)
         self._current_prompt: Optional[str] = None
 
-        # I-frame cache for late-joining viewers
-        self._last_keyframe_nal: Optional[bytes] = None
+        # I-frame cache for late-joining viewers (full 0x01-prefixed message,
+        # so it can be sent as-is)
+        self._last_keyframe_message: Optional[bytes] = None
         self._last_keyframe_meta: Optional[dict] = None
 
+        # In-flight state saves. They run off the GPU receive loop, so frames
+        # keep flowing while a snapshot is written; the event loop only keeps
+        # weak references to running tasks.
+        self._state_save_tasks: set[asyncio.Task] = set()
+
         # MPEG-TS muxer for /api/dreams/stream endpoint
         self._mpegts_muxer = None
         try:
@@ -109,52 +210,85 @@ class DreamWebSocketHub:
     def status(self) -> str:
         return self._status
 
-    def set_status(self, status: str, message: str = "") -> None:
-        """Update status and optionally broadcast to viewers."""
+    def set_status(self, status: str, message: str = "") -> bool:
+        """Update status; returns False if it was already current."""
+        if status == self._status and message == self._status_message:
+            return False
         self._status = status
         self._status_message = message
         logger.info(f"Status changed: {status} - {message}")
+        return True
 
     # ==================== Viewer Connections ====================
 
     async def connect_viewer(self, websocket: WebSocket) -> None:
         """Handle a new browser viewer connection."""
         await websocket.accept()
+        packed = websocket.query_params.get("v") == PACKED_FRAME_PROTOCOL
 
-        async with self._lock:
-            self._viewers.add(websocket)
-
-        # Track presence (may trigger GPU start)
-        await self.presence.on_viewer_connect(websocket)
+        # Register and queue the initial messages without awaiting in between,
+        # so no broadcast can land ahead of them
+        channel = _ViewerChannel(websocket, packed)
+        self._viewers = {**self._viewers, websocket: channel}
 
         # Send current status
-        await self._send_status_to_viewer(websocket)
+        channel.push(_encode_json(self._viewer_status_message()))
 
         # Send cached I-frame so viewer can start decoding immediately
-        if self._last_keyframe_nal:
-            try:
-                meta_msg = {
-                    "type": "frame_meta",
-                    **(self._last_keyframe_meta or {}),
-                    "vk": True,
-                }
-                await asyncio.wait_for(websocket.send_json(meta_msg), timeout=5.0)
-                await asyncio.wait_for(
-                    websocket.send_bytes(
-                        bytes([MSG_FRAME]) + self._last_keyframe_nal
-                    ),
-                    timeout=5.0
+        if self._last_keyframe_message:
+            meta_msg = {
+                "type": "frame_meta",
+                **(self._last_keyframe_meta or {}),
+                "vk": True,
+            }
+            if packed:
+                channel.push_frame(
+                    True, _pack_frame(meta_msg, memoryview(self._last_keyframe_message)[1:])
                 )
-            except (asyncio.TimeoutError, Exception) as e:
-                logger.warning(f"Failed to send initial I-frame: {e}")
+            else:
+                channel.push_frame(True, _encode_json(meta_msg), self._last_keyframe_message)
+
+        channel.task = asyncio.create_task(self._pump_viewer(channel))
+
+        # Track presence (may trigger GPU start)
+        await self.presence.on_viewer_connect(websocket)
 
     async def disconnect_viewer(self, websocket: WebSocket) -> None:
         """Handle viewer disconnection."""
-        async with self._lock:
-            self._viewers.discard(websocket)
+        await self._remove_viewer(websocket)
+
+    async def _remove_viewer(self, websocket: WebSocket) -> None:
+        """Unregister a viewer and stop its pump. Safe to call more than once."""
+        channel = self._viewers.get(websocket)
+        if channel is None:
+            return
+
+        self._viewers = {ws: ch for ws, ch in self._viewers.items() if ws is not websocket}
+        if channel.task is not None and channel.task is not asyncio.current_task():
+            channel.task.cancel()
 
         await self.presence.on_viewer_disconnect(websocket)
 
+    async def _pump_viewer(self, channel: _ViewerChannel) -> None:
+        """Drain one viewer's queue; a failed or stalled send drops the viewer."""
+        websocket = channel.websocket
+        try:
+            while True:
+                is_frame, messages = await channel.queue.get()
+                for message in messages:
+                    if isinstance(message, str):
+                        send = websocket.send_text(message)
+                    else:
+                        send = websocket.send_bytes(message)
+                    await asyncio.wait_for(send, timeout=VIEWER_SEND_TIMEOUT)
+                if is_frame:
+                    channel.queued_frames -= 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Dropping viewer after failed send: {e!r}")
+            await self._remove_viewer(websocket)
+
     async def handle_viewer_message(self, websocket: WebSocket, data: str) -> None:
         """Handle message from viewer."""
         try:
@@ -167,25 +301,21 @@ class DreamWebSocketHub:
         except json.JSONDecodeError:
             logger.warning(f"Invalid JSON from viewer: {data[:100]}")
 
-    async def _send_status_to_viewer(self, websocket: WebSocket) -> None:
-        """Send current status to a specific viewer."""
-        try:
-            await asyncio.wait_for(
-                websocket.send_json({
-                    "type": "status",
-                    "status": self._status,
-                    "message": self._status_message,
-                    "frame_count": self.frame_cache.total_frames_received,
-                    "viewer_count": self.viewer_count,
-                }),
-                timeout=5.0
-            )
-        except (asyncio.TimeoutError, Exception) as e:
-            logger.warning(f"Failed to send status: {e}")
+    def _viewer_status_message(self) -> dict:
+        """Build the status message sent to newly connected viewers."""
+        return {
+            "type": "status",
+            "status": self._status,
+            "message": self._status_message,
+            "frame_count": self.frame_cache.total_frames_received,
+            "viewer_count": self.viewer_count,
+        }
 
     async def broadcast_status(self, status: str, message: str) -> None:
-        """Broadcast status update to all viewers."""
-        self.set_status(status, message)
+        """Broadcast status update to all viewers, unless it is unchanged."""
+        # New viewers get the current status on connect, so a repeat adds nothing
+        if not self.set_status(status, message):
+            return
 
         status_msg = {
             "type": "status",
@@ -236,7 +366,7 @@ class DreamWebSocketHub:
         if not replacing:
             self.frame_cache.reset_session()
             self._next_frame_number = 1
-            self._last_keyframe_nal = None
+            self._last_keyframe_message = None
             self._last_keyframe_meta = None
 
         logger.info("GPU connected")
@@ -263,8 +393,8 @@ class DreamWebSocketHub:
 
             logger.info(f"Sending saved state to GPU: {len(saved_state)} bytes (age: {state_info.get('age_seconds', '?')}s)")
             await asyncio.wait_for(
-                websocket.send_bytes(bytes([CTRL_LOAD_STATE]) + saved_state),
-                timeout=30.0
+                websocket.send_bytes(_CTRL_LOAD_STATE_PREFIX + saved_state),
+                timeout=GPU_STATE_SEND_TIMEOUT
             )
             logger.info("Saved state sent to GPU for restoration")
 
@@ -291,8 +421,10 @@ class DreamWebSocketHub:
         if len(data) < 1:
             return
 
+        # Slice through a memoryview so frame payloads (the bulk of traffic)
+        # aren't copied just to strip the type byte
         msg_type = data[0]
-        payload = data[1:] if len(data) > 1 else b""
+        payload = memoryview(data)[1:]
 
         if msg_type == MSG_FRAME:
             await self._handle_gpu_frame(payload)
@@ -301,11 +433,11 @@ class DreamWebSocketHub:
             await self._handle_gpu_state(payload)
 
         elif msg_type == MSG_HEARTBEAT:
-            self._last_frame_time = time.time()
+            self._last_frame_time = time.monotonic()
 
         elif msg_type == MSG_STATUS:
             try:
-                status = json.loads(payload.decode())
+                status = json.loads(bytes(payload))
                 logger.debug(f"GPU status: {status}")
 
                 if "target_fps" in status:
@@ -315,7 +447,7 @@ class DreamWebSocketHub:
             except Exception as e:
                 logger.warning(f"Failed to parse GPU status: {e}")
 
-    async def _handle_gpu_frame(self, payload: bytes) -> None:
+    async def _handle_gpu_frame(self, payload: memoryview) -> None:
         """
         Handle H.264 video frame from GPU — parse metadata and pass through
         directly to all viewers.
@@ -324,15 +456,20 @@ class DreamWebSocketHub:
 
         No buffering or pacing — the browser's VideoDecoder handles that.
         I-frames are cached for late-joining viewers.
+
+        The NAL data is copied exactly once, into the 0x01-prefixed message
+        sent to viewers; everything else (muxer, stats, I-frame cache) works
+        off that message or views into it.
         """
-        self._last_frame_time = time.time()
+        now = time.monotonic()
+        self._last_frame_time = now
 
         # Parse metadata
         frame_number = self._next_frame_number
         keyframe_number = 0
         prompt = None
         is_video_keyframe = False
-        nal_data = payload
+        nal_view = payload
 
         if len(payload) > 4:
             # Check if first bytes look like a length prefix (not RIFF header)
@@ -342,10 +479,10 @@ class DreamWebSocketHub:
                     metadata_len = int.from_bytes(first_four, 'big')
 
                     if 0 < metadata_len < len(payload) - 4:
-                        metadata_bytes = payload[4:4 + metadata_len]
-                        nal_data = payload[4 + metadata_len:]
+                        metadata_bytes = bytes(payload[4:4 + metadata_len])
+                        nal_view = payload[4 + metadata_len:]
 
-                        metadata = json.loads(metadata_bytes.decode('utf-8'))
+                        metadata = json.loads(metadata_bytes)
                         frame_number = metadata.get('fn', frame_number)
                         keyframe_number = metadata.get('kf', 0)
                         is_video_keyframe = metadata.get('vk', False)
@@ -353,13 +490,17 @@ class DreamWebSocketHub:
                         if 'p' in metadata and isinstance(metadata['p'], str):
                             self._current_prompt = metadata['p']
                             prompt = metadata['p']
-                            logger.debug(f"Frame {frame_number} prompt: {prompt[:60]}...")
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(f"Frame {frame_number} prompt: {prompt[:60]}...")
                 except Exception as e:
-                    if nal_data is payload:
+                    if nal_view is payload:
                         logger.debug(f"Metadata parse failed, using raw payload: {e}")
                     else:
                         logger.warning(f"Error after frame extraction (data preserved): {e}")
 
+        frame_message = _MSG_FRAME_PREFIX + nal_view
+        nal_data = memoryview(frame_message)[1:]
+
         # Update frame counter
         if frame_number == self._next_frame_number:
             self._next_frame_number += 1
@@ -368,7 +509,7 @@ class DreamWebSocketHub:
 
         # Cache I-frame for late joiners
         if is_video_keyframe:
-            self._last_keyframe_nal = nal_data
+            self._last_keyframe_message = frame_message
             meta_for_cache: dict = {
                 "fn": frame_number,
                 "kf": keyframe_number,
@@ -382,6 +523,7 @@ class DreamWebSocketHub:
             size_bytes=len(nal_data),
             frame_number=frame_number,
             keyframe_number=keyframe_number,
+            now=now,
         )
 
         # Feed to MPEG-TS muxer for /api/dreams/stream
@@ -393,18 +535,34 @@ class DreamWebSocketHub:
 
         # Pass through directly to all viewers (no buffering)
         await self._broadcast_video_frame(
-            nal_data, frame_number, keyframe_number,
+            frame_message, frame_number, keyframe_number,
             prompt or self._current_prompt, is_video_keyframe
         )
 
-    async def _handle_gpu_state(self, state_data: bytes) -> None:
-        """Handle state snapshot from GPU — persist to disk for recovery."""
+    async def _handle_gpu_state(self, state_data: memoryview) -> None:
+        """
+        Handle state snapshot from GPU — persist to disk for recovery.
+
+        The save runs as a background task rather than being awaited here, so
+        the receive loop can take the next message (and a newer snapshot can
+        supersede one still queued in state_storage's coalescing writer).
+        """
         from .state_storage import save_state
 
         logger.debug(f"Received state snapshot: {len(state_data)} bytes")
 
-        saved = await save_state(state_data)
-        if saved:
+        task = asyncio.create_task(save_state(state_data))
+        self._state_save_tasks.add(task)
+        task.add_done_callback(self._on_state_saved)
+
+    def _on_state_saved(self, task: asyncio.Task) -> None:
+        """Log the outcome of a background state save."""
+        self._state_save_tasks.discard(task)
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.warning(f"Failed to persist state to disk: {task.exception()}")
+        elif task.result():
             logger.debug("State persisted to disk")
         else:
             logger.warning("Failed to persist state to disk")
@@ -413,7 +571,7 @@ class DreamWebSocketHub:
 
     async def _broadcast_video_frame(
         self,
-        nal_data: bytes,
+        frame_message: bytes,
         frame_number: int = 0,
         keyframe_number: int = 0,
         prompt: Optional[str] = None,
@@ -422,11 +580,13 @@ class DreamWebSocketHub:
         """
         Broadcast H.264 video frame to all connected viewers.
 
-        Sends a JSON metadata message followed by the binary NAL data.
-        The metadata includes the video keyframe flag so the client's
-        VideoDecoder knows whether this is an I-frame or P-frame.
+        Queues a JSON metadata message followed by the binary frame message
+        (0x01 + NAL data). The metadata includes the video keyframe flag so the client's
+        VideoDecoder knows whether this is an I-frame or P-frame. Viewers on the
+        packed (v2) format get both in a single 0x05 message instead.
         """
-        if not self._viewers:
+        channels = self._viewers.values()
+        if not channels:
             return
 
         meta_msg: dict = {
@@ -438,45 +598,30 @@ class DreamWebSocketHub:
         if prompt:
             meta_msg["p"] = prompt
 
-        frame_message = bytes([MSG_FRAME]) + nal_data
-        dead_viewers: set[WebSocket] = set()
-
-        async with self._lock:
-            viewers = set(self._viewers)
-
-        for viewer in viewers:
-            try:
-                await asyncio.wait_for(viewer.send_json(meta_msg), timeout=5.0)
-                await asyncio.wait_for(viewer.send_bytes(frame_message), timeout=5.0)
-            except (asyncio.TimeoutError, Exception):
-                dead_viewers.add(viewer)
-
-        if dead_viewers:
-            async with self._lock:
-                self._viewers -= dead_viewers
-
-            for viewer in dead_viewers:
-                await self.presence.on_viewer_disconnect(viewer)
+        # Encode once per frame rather than once per viewer, and only in the
+        # formats someone actually asked for
+        meta_text: Optional[str] = None
+        packed_message: Optional[bytes] = None
+
+        for channel in channels:
+            if channel.packed:
+                if packed_message is None:
+                    packed_message = _pack_frame(meta_msg, memoryview(frame_message)[1:])
+                channel.push_frame(is_video_keyframe, packed_message)
+            else:
+                if meta_text is None:
+                    meta_text = _encode_json(meta_msg)
+                channel.push_frame(is_video_keyframe, meta_text, frame_message)
 
     async def _broadcast_json(self, data: dict) -> None:
         """Broadcast JSON message to all viewers."""
-        if not self._viewers:
+        channels = self._viewers.values()
+        if not channels:
             return
 
-        dead_viewers: set[WebSocket] = set()
-
-        async with self._lock:
-            viewers = set(self._viewers)
-
-        for viewer in viewers:
-            try:
-                await asyncio.wait_for(viewer.send_json(data), timeout=5.0)
-            except (asyncio.TimeoutError, Exception):
-                dead_viewers.add(viewer)
-
-        if dead_viewers:
-            async with self._lock:
-                self._viewers -= dead_viewers
+        text = _encode_json(data)
+        for channel in channels:
+            channel.push(text)
 
     # ==================== GPU Control ====================
 
@@ -485,10 +630,11 @@ class DreamWebSocketHub:
         if not self._gpu_websocket:
             return False
 
+        prefix = _PREFIX.get(msg_type) or bytes([msg_type])
         try:
             await asyncio.wait_for(
-                self._gpu_websocket.send_bytes(bytes([msg_type]) + payload),
-                timeout=10.0
+                self._gpu_websocket.send_bytes(prefix + payload),
+                timeout=GPU_CONTROL_TIMEOUT
             )
             return True
         except asyncio.TimeoutError:
@@ -518,8 +664,8 @@ class DreamWebSocketHub:
             "status_message": self._status_message,
             "viewer_count": self.viewer_count,
             "gpu_connected": self.gpu_connected,
-            "last_frame_age_seconds": round(time.time() - self._last_frame_time, 1) if self._last_frame_time > 0 else None,
-            "has_video_keyframe": self._last_keyframe_nal is not None,
+            "last_frame_age_seconds": round(time.monotonic() - self._last_frame_time, 1) if self._last_frame_time > 0 else None,
+            "has_video_keyframe": self._last_keyframe_message is not None,
             **cache_stats,
             **presence_stats,
         }
@@ -259,6 +259,9 @@ class InteractiveGenerator:
         self.state: Optional[InteractiveState] = None
         self._user_input_event = asyncio.Event()
         self._user_selection: Optional[int] = None
+        # Strong refs for fire-and-forget tasks spawned from sync methods;
+        # the event loop only keeps weak references to running tasks
+        self._background_tasks: set[asyncio.Task] = set()
     
     def _create_provider(self, provider_config: ProviderConfig) -> InferenceProvider:
         """Create a provider from config.
@@ -823,7 +826,9 @@ class InteractiveGenerator:
             self.state.should_stop = True
             # Emit a log message to let the user know
             if self.event_callback:
-                asyncio.create_task(self._log("warning", "Stop requested - will halt after current chunk"))
+                task = asyncio.create_task(self._log("warning", "Stop requested - will halt after current chunk"))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
         self._user_input_event.set()
     
     def get_state(self) -> Optional[SessionState]:
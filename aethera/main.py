@@ -1,32 +1,42 @@
-from fastapi import FastAPI, Depends, Request
+from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
+import anyio.to_thread
+import os
 import uvicorn
 from pathlib import Path
-from sqlmodel import Session
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-from aethera.models.base import init_db, get_session
+from aethera.models.base import init_db
 from aethera.api import posts, comments, seo, dreams, apeiron, irc, irc_admin
 from aethera.irc.database import init_irc_db
+from aethera.dreams.comfyui_registry import close_registry
 from aethera.utils.security import SecurityHeadersMiddleware
 from aethera.utils.templates import templates
 
 
+# Sync endpoints (all DB access goes through sync SQLModel sessions) run in
+# AnyIO's worker threadpool, which defaults to 40 threads. Crawler bursts on
+# the DB-backed routes can exhaust that, so allow a larger pool.
+THREADPOOL_SIZE = int(os.environ.get("AETHERA_THREADPOOL_SIZE", "100"))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
     # Initialize databases on startup
     init_db()      # Blog database (blog.sqlite)
     init_irc_db()  # IRC database (irc.sqlite) - separate for clean isolation
     yield
     # Clean up resources on shutdown
-    pass
+    await close_registry()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -67,7 +77,7 @@ async def custom_http_exception_handler(request: Request, exc: StarletteHTTPExce
 
 
 @app.get("/")
-def home(request: Request, session: Session = Depends(get_session)):
+async def home(request: Request):
     """Render the homepage with latest posts."""
     return templates.TemplateResponse(
         request=request,
@@ -77,13 +87,12 @@ def home(request: Request, session: Session = Depends(get_session)):
 
 
 @app.get("/healthz")
-def health_check():
+async def health_check():
     """Health check endpoint."""
     return {"status": "ok"}
 
 
 if __name__ == "__main__":
-    import os
     # Only enable reload in development (when AETHERA_DEV is set)
     reload = os.environ.get("AETHERA_DEV", "").lower() in ("1", "true", "yes")
     uvicorn.run("aethera.main:app", host="0.0.0.0", port=2222, reload=reload)
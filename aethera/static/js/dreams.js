@@ -16,6 +16,9 @@
  */
 
 const MSG_FRAME = 0x01;
+// Packed frame (?v=2): 0x05 | metadata_len (4B BE) | JSON metadata | NAL data
+const MSG_PACKED_FRAME = 0x05;
+const textDecoder = new TextDecoder();
 
 class DreamViewer {
     constructor(options = {}) {
@@ -509,7 +512,7 @@ class DreamViewer {
         this.setConnectionState('connecting');
 
         const protocol = location.protocol === 'https:' ? 'wss:' : 'ws:';
-        const wsUrl = `${protocol}//${location.host}/ws/dreams`;
+        const wsUrl = `${protocol}//${location.host}/ws/dreams?v=2`;
 
         try {
             this.ws = new WebSocket(wsUrl);
@@ -563,9 +566,23 @@ class DreamViewer {
 
     handleBinaryMessage(data) {
         const view = new Uint8Array(data);
-        if (view[0] !== MSG_FRAME) return;
+        let nalData;
 
-        const nalData = data.slice(1);
+        if (view[0] === MSG_PACKED_FRAME) {
+            const metaLen = new DataView(data, 1, 4).getUint32(0);
+            try {
+                this.handleFrameMetaMessage(
+                    JSON.parse(textDecoder.decode(view.subarray(5, 5 + metaLen)))
+                );
+            } catch (e) {
+                console.error('Frame metadata parse failed:', e);
+            }
+            nalData = data.slice(5 + metaLen);
+        } else if (view[0] === MSG_FRAME) {
+            nalData = data.slice(1);
+        } else {
+            return;
+        }
 
         if (this.decodePath === 'webcodecs') {
             this._feedWebCodecs(nalData);
@@ -3,7 +3,7 @@ Post utilities for shared functionality.
 """
 from typing import Optional
 from datetime import datetime
-from sqlmodel import Session
+from sqlmodel import Session, select
 from slugify import slugify
 
 from aethera.models.models import Post, SlugRedirect
@@ -28,6 +28,8 @@ def save_post(
 
     When updating, if the title changes, the slug is regenerated and the old
     slug is stored as a redirect so that existing links continue to work.
+    If the content is unchanged, the stored HTML and excerpt are reused
+    instead of re-rendering the markdown.
 
     Args:
         session: SQLModel session
@@ -45,11 +47,16 @@ def save_post(
     Returns:
         The created or updated Post instance
     """
-    # Render Markdown to HTML
-    content_html = render_markdown(content)
+    if existing_post and content == existing_post.content:
+        # Metadata-only edit: the rendered HTML and excerpt are still valid
+        content_html = existing_post.content_html
+        excerpt = existing_post.excerpt
+    else:
+        # Render Markdown to HTML
+        content_html = render_markdown(content)
 
-    # Generate excerpt
-    excerpt = Post.create_excerpt(content)
+        # Generate excerpt
+        excerpt = Post.create_excerpt(content)
 
     if existing_post:
         # If title changed, regenerate slug and save redirect
@@ -0,0 +1,28 @@
+"""add index on comment.post_id for per-post comment counts
+
+Revision ID: add_comment_post_idx
+Revises: add_irc_fragments
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_comment_post_idx'
+down_revision: Union[str, None] = 'add_irc_fragments'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index comment.post_id (the model declares it, but the initial schema never created it)."""
+    op.create_index(op.f('ix_comment_post_id'), 'comment', ['post_id'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Drop the comment.post_id index."""
+    op.drop_index(op.f('ix_comment_post_id'), table_name='comment', if_exists=True)
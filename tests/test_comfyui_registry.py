@@ -0,0 +1,93 @@
+import asyncio
+
+import httpx
+import pytest
+
+from aethera.dreams import comfyui_registry as registry
+
+
+class MockComfyUI:
+    """Answers health probes with a status per HTTP method and logs them."""
+
+    def __init__(self):
+        self.statuses = {"HEAD": 200, "GET": 200}
+        self.requests = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.method)
+        return httpx.Response(self.statuses[request.method])
+
+
+@pytest.fixture(name="comfyui")
+def comfyui_fixture(monkeypatch):
+    comfyui = MockComfyUI()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(comfyui.handler))
+    monkeypatch.setattr(registry, "_http_client", client)
+    monkeypatch.setattr(registry, "_health_inflight", None)
+    monkeypatch.setattr(registry, "_health_task", None)
+    monkeypatch.setattr(
+        registry, "_comfyui_endpoint", registry.ComfyUIEndpoint(ip="10.0.0.1", port=8188)
+    )
+    return comfyui
+
+
+def test_probes_within_ttl_share_one_request(comfyui):
+    async def run():
+        # Concurrent callers join the in-flight probe...
+        first, second = await asyncio.gather(
+            registry.health_check_comfyui(), registry.health_check_comfyui()
+        )
+        # ...and a later one inside the TTL reuses its result
+        third = await registry.health_check_comfyui()
+        return [first, second, third]
+
+    assert asyncio.run(run()) == [True, True, True]
+    assert comfyui.requests == ["HEAD"]
+
+    # max_age=0 always probes
+    assert asyncio.run(registry.health_check_comfyui(max_age=0)) is True
+    assert comfyui.requests == ["HEAD", "HEAD"]
+
+
+def test_head_rejected_falls_back_to_get(comfyui):
+    comfyui.statuses["HEAD"] = 405
+
+    assert asyncio.run(registry.health_check_comfyui()) is True
+    assert comfyui.requests == ["HEAD", "GET"]
+    assert registry._comfyui_endpoint.healthy is True
+
+
+def test_unhealthy_when_get_fails_too(comfyui):
+    comfyui.statuses.update(HEAD=405, GET=503)
+
+    assert asyncio.run(registry.health_check_comfyui()) is False
+    assert registry._comfyui_endpoint.healthy is False
+
+
+def test_health_loop_backs_off_while_unhealthy(comfyui, monkeypatch):
+    # One healthy probe, three failures, then healthy again
+    outcomes = iter([200, 500, 500, 500, 200])
+    intervals = []
+
+    def handler(request):
+        # HEAD and its GET fallback agree, so each probe consumes one outcome
+        if request.method == "HEAD":
+            comfyui.statuses["GET"] = next(outcomes)
+            return httpx.Response(comfyui.statuses["GET"])
+        return httpx.Response(comfyui.statuses["GET"])
+
+    monkeypatch.setattr(
+        registry, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    async def fake_sleep(delay):
+        intervals.append(delay)
+        if len(intervals) == 5:
+            # Unregistering ends the loop
+            registry._comfyui_endpoint = None
+
+    monkeypatch.setattr(registry.asyncio, "sleep", fake_sleep)
+
+    asyncio.run(registry._health_loop(registry._comfyui_endpoint))
+
+    assert intervals == [10.0, 20.0, 30.0, 30.0, 10.0]
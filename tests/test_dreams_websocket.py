@@ -0,0 +1,127 @@
+import asyncio
+import json
+
+from aethera.dreams import websocket as hub_module
+from aethera.dreams.frame_cache import FrameCache
+from aethera.dreams.presence import ViewerPresenceTracker
+from aethera.dreams.websocket import DreamWebSocketHub, _ViewerChannel, _pack_frame
+
+
+class FakeWebSocket:
+    """Records what the hub sends; sends block while the gate is closed."""
+
+    def __init__(self, query_params=None, blocked=False):
+        self.query_params = query_params or {}
+        self.sent = []
+        self.gate = asyncio.Event()
+        if not blocked:
+            self.gate.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data):
+        await self.gate.wait()
+        self.sent.append(data)
+
+    async def send_bytes(self, data):
+        await self.gate.wait()
+        self.sent.append(bytes(data))
+
+
+def gpu_frame(frame_number, video_keyframe, nal=b"\x00\x00\x00\x01e"):
+    meta = json.dumps({"fn": frame_number, "kf": 1, "vk": video_keyframe}).encode()
+    return bytes([hub_module.MSG_FRAME]) + len(meta).to_bytes(4, "big") + meta + nal
+
+
+def sent_frame_numbers(ws):
+    return [json.loads(m)["fn"] for m in ws.sent if isinstance(m, str) and "frame_meta" in m]
+
+
+def test_channel_queues_at_most_limit_then_skips_to_keyframe():
+    channel = _ViewerChannel(FakeWebSocket(), packed=False)
+
+    channel.push_frame(True, "k1")
+    channel.push_frame(False, "p2")
+    channel.push_frame(False, "p3")   # over the limit: dropped
+    channel.push_frame(False, "p4")   # can't decode without p3: dropped
+    channel.push("status")            # non-frame messages are never dropped
+    channel.push_frame(True, "k5")    # keyframes always get in
+
+    queued = []
+    while not channel.queue.empty():
+        queued.append(channel.queue.get_nowait()[1])
+    assert queued == [("k1",), ("p2",), ("status",), ("k5",)]
+    assert channel.queued_frames == hub_module.VIEWER_QUEUE_FRAMES + 1
+
+
+def test_slow_viewer_skips_to_next_keyframe_without_blocking_others():
+    async def run():
+        hub = DreamWebSocketHub(FrameCache(), ViewerPresenceTracker())
+        fast, slow = FakeWebSocket(), FakeWebSocket(blocked=True)
+        await hub.connect_viewer(fast)
+        await hub.connect_viewer(slow)
+
+        # Frames arrive paced, giving pumps a chance to run in between
+        for n, video_keyframe in enumerate([True, False, False, False, False, True, False], 1):
+            await hub.handle_gpu_message(gpu_frame(n, video_keyframe))
+            await asyncio.sleep(0.001)
+
+        slow.gate.set()
+        await asyncio.sleep(0.01)
+        return fast, slow
+
+    fast, slow = asyncio.run(run())
+
+    assert sent_frame_numbers(fast) == [1, 2, 3, 4, 5, 6, 7]
+    # The status message is stuck in flight, 1 and 2 fill the queue, 3-5
+    # are skipped until keyframe 6; 7 arrives while it is still backed up
+    assert sent_frame_numbers(slow) == [1, 2, 6]
+
+
+def test_viewer_dropped_after_send_timeout(monkeypatch):
+    monkeypatch.setattr(hub_module, "VIEWER_SEND_TIMEOUT", 0.05)
+
+    async def run():
+        hub = DreamWebSocketHub(FrameCache(), ViewerPresenceTracker())
+        stuck = FakeWebSocket(blocked=True)
+        await hub.connect_viewer(stuck)
+        assert hub.viewer_count == 1
+
+        await asyncio.sleep(0.15)
+        return hub
+
+    hub = asyncio.run(run())
+
+    assert hub.viewer_count == 0
+    assert hub.presence.viewer_count == 0
+
+
+def test_pack_frame_layout():
+    meta = {"type": "frame_meta", "fn": 7, "kf": 1, "vk": True, "p": "hi"}
+    nal = b"\x00\x00\x00\x01eabc"
+    meta_json = b'{"type":"frame_meta","fn":7,"kf":1,"vk":true,"p":"hi"}'
+
+    assert _pack_frame(meta, nal) == (
+        b"\x05" + len(meta_json).to_bytes(4, "big") + meta_json + nal
+    )
+
+
+def test_packed_viewer_gets_one_message_per_frame():
+    async def run():
+        hub = DreamWebSocketHub(FrameCache(), ViewerPresenceTracker())
+        v1, v2 = FakeWebSocket(), FakeWebSocket(query_params={"v": "2"})
+        await hub.connect_viewer(v1)
+        await hub.connect_viewer(v2)
+        await hub.handle_gpu_message(gpu_frame(3, True))
+        await asyncio.sleep(0.01)
+        return v1, v2
+
+    v1, v2 = asyncio.run(run())
+
+    meta_json = b'{"type":"frame_meta","fn":3,"kf":1,"vk":true}'
+    frame = b"\x05" + len(meta_json).to_bytes(4, "big") + meta_json + b"\x00\x00\x00\x01e"
+    assert v2.sent[1:] == [frame]
+    # v1 keeps the two-message format
+    assert json.loads(v1.sent[1])["fn"] == 3
+    assert v1.sent[2] == b"\x01\x00\x00\x00\x01e"
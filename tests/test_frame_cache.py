@@ -0,0 +1,61 @@
+import pytest
+
+from aethera.dreams import frame_cache
+from aethera.dreams.frame_cache import FrameCache
+
+
+class FakeClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(name="clock")
+def clock_fixture(monkeypatch):
+    clock = FakeClock(1000.0)
+    monkeypatch.setattr(frame_cache.time, "monotonic", clock)
+    return clock
+
+
+def record_second(cache: FrameCache, second: int, frames: int) -> None:
+    for i in range(frames):
+        cache.record_frame(size_bytes=100, now=second + i / frames)
+
+
+def test_rolling_fps_spans_several_buckets(clock):
+    cache = FrameCache()
+    record_second(cache, 1000, 10)
+    record_second(cache, 1001, 10)
+    record_second(cache, 1002, 10)
+
+    clock.now = 1003.0
+    stats = cache.get_stats()
+
+    assert stats["total_frames_received"] == 30
+    assert stats["average_fps"] == 10.0
+
+
+def test_rolling_fps_ignores_stale_buckets_after_gap(clock):
+    cache = FrameCache()
+    record_second(cache, 1000, 20)
+    record_second(cache, 1001, 20)
+
+    # 40s later the old seconds are out of the window, including any slot
+    # the new frames don't overwrite
+    record_second(cache, 1042, 5)
+    clock.now = 1043.0
+    assert cache.get_stats()["average_fps"] == 5.0
+
+    clock.now = 1100.0
+    assert cache.get_stats()["average_fps"] == 0.0
+
+
+def test_uptime_uses_monotonic_clock(clock, monkeypatch):
+    cache = FrameCache()
+    # A wall-clock step (NTP, DST) must not affect uptime
+    monkeypatch.setattr(frame_cache.time, "time", lambda: 0.0)
+
+    clock.now = 1120.0
+    assert cache.get_stats()["uptime_seconds"] == 120.0
@@ -11,9 +11,11 @@ def test_llms_txt(client: TestClient):
     assert "æthera" in response.text
 
 def test_feed_xml(client: TestClient):
+    import xml.etree.ElementTree as ET
     response = client.get("/feed.xml")
     assert response.status_code == 200
     assert "rss" in response.text
+    ET.fromstring(response.content)  # namespace declarations must not be duplicated
 
 def test_read_post(client: TestClient, session):
     from aethera.models.models import Post
@@ -32,3 +34,41 @@ def test_read_post(client: TestClient, session):
     assert response.status_code == 200
     assert "Test Post" in response.text
     assert "og:title" in response.text
+
+def test_robots_txt_cached(client: TestClient):
+    response = client.get("/robots.txt")
+    assert response.status_code == 200
+    assert "Sitemap: http://testserver/sitemap.xml" in response.text
+    etag = response.headers["etag"]
+    assert "max-age" in response.headers["cache-control"]
+
+    cached = client.get("/robots.txt", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+def test_feed_rebuilt_after_post_edit(client: TestClient, session):
+    from datetime import datetime, timedelta, timezone
+    from aethera.models.models import Post
+    post = Post(
+        title="Feed Post",
+        slug="feed-post",
+        content="Original.",
+        content_html="<p>Original.</p>",
+        published=True,
+        author="admin"
+    )
+    session.add(post)
+    session.commit()
+
+    assert "Feed Post" in client.get("/feed.xml").text
+    # Served from the artifact cache while nothing has changed
+    assert "Feed Post" in client.get("/feed.xml").text
+
+    post.title = "Renamed Feed Post"
+    post.content_html = "<p>Edited.</p>"
+    post.updated_at = datetime.now(timezone.utc) + timedelta(seconds=1)
+    session.add(post)
+    session.commit()
+
+    response = client.get("/feed.xml")
+    assert "Renamed Feed Post" in response.text
+    assert "Edited." in response.text
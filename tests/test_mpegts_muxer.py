@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from aethera.dreams import mpegts_muxer
+from aethera.dreams.mpegts_muxer import MpegTSMuxer
+
+
+@pytest.fixture(name="make_muxer")
+def make_muxer_fixture(monkeypatch):
+    """Build muxers without PyAV; tests append pre-muxed segments directly."""
+    monkeypatch.setattr(mpegts_muxer, "HAS_AV", True)
+    monkeypatch.setattr(MpegTSMuxer, "_init_muxer", lambda self: None)
+    return MpegTSMuxer
+
+
+def ring(muxer):
+    return [seg.data for seg in muxer._segments]
+
+
+def test_ring_evicts_oldest_past_max_bytes(make_muxer):
+    muxer = make_muxer(max_bytes=10)
+
+    for data in [b"aaaa", b"bbbb", b"cccc"]:
+        muxer._append_segment(data, is_keyframe=False)
+
+    assert ring(muxer) == [b"bbbb", b"cccc"]
+    assert muxer._segments_bytes == 8
+
+
+def test_ring_keeps_newest_segment_even_if_oversized(make_muxer):
+    muxer = make_muxer(max_bytes=10)
+
+    muxer._append_segment(b"aaaa", is_keyframe=True)
+    muxer._append_segment(b"x" * 16, is_keyframe=True)
+
+    assert ring(muxer) == [b"x" * 16]
+    assert muxer._segments_bytes == 16
+
+
+def test_ring_evicts_past_max_segments(make_muxer):
+    muxer = make_muxer(max_segments=3)
+
+    for n in range(5):
+        muxer._append_segment(b"s%d" % n, is_keyframe=False)
+
+    assert ring(muxer) == [b"s2", b"s3", b"s4"]
+    assert [seg.sequence for seg in muxer._segments] == [3, 4, 5]
+
+
+def test_consume_starts_from_latest_keyframe(make_muxer):
+    muxer = make_muxer()
+    for data, keyframe in [(b"k1", True), (b"p2", False), (b"k3", True), (b"p4", False)]:
+        muxer._append_segment(data, keyframe)
+
+    async def run():
+        consumer = muxer.consume()
+        backlog = [await anext(consumer), await anext(consumer)]
+        await consumer.aclose()
+        return backlog
+
+    assert asyncio.run(run()) == [b"k3", b"p4"]
+
+
+def test_lagging_consumer_gets_only_newest_segments(make_muxer):
+    muxer = make_muxer(max_segments=4)
+    muxer._append_segment(b"s1", is_keyframe=True)
+
+    async def run():
+        consumer = muxer.consume()
+        received = [await anext(consumer)]
+
+        # The consumer is parked waiting; ten segments land before it runs
+        pending = asyncio.create_task(anext(consumer))
+        await asyncio.sleep(0)
+        for n in range(2, 12):
+            muxer._append_segment(b"s%d" % n, is_keyframe=False)
+
+        received.append(await pending)
+        while len(received) < 5:
+            received.append(await anext(consumer))
+        await consumer.aclose()
+        return received
+
+    # s2..s7 were evicted before the consumer caught up
+    assert asyncio.run(run()) == [b"s1", b"s8", b"s9", b"s10", b"s11"]
+    assert muxer._waiters == []
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.responses import HTMLResponse
+from fastapi.testclient import TestClient
+
+from aethera.api import posts as posts_api
+from aethera.models.models import Post
+from aethera.utils import posts as posts_utils
+
+
+@pytest.fixture(name="rendered")
+def rendered_fixture(monkeypatch):
+    """Capture the template context instead of rendering the fragment."""
+    contexts = []
+
+    def capture(name, context, *args, **kwargs):
+        contexts.append(context)
+        return HTMLResponse("")
+
+    monkeypatch.setattr(posts_api.templates, "TemplateResponse", capture)
+    return contexts
+
+
+def add_posts(session, count):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for n in range(count):
+        session.add(Post(
+            title=f"Post {n}",
+            slug=f"post-{n}",
+            content=f"Body {n}.",
+            content_html=f"<p>Body {n}.</p>",
+            published=True,
+            author="admin",
+            created_at=start + timedelta(days=n),
+        ))
+    session.commit()
+
+
+def get_page(client, rendered, page, per_page):
+    response = client.get("/posts", params={"page": page, "per_page": per_page})
+    assert response.status_code == 200
+    context = rendered[-1]
+    return [p.slug for p in context["posts"]], context["has_next_page"]
+
+
+def test_get_posts_has_next_page(client: TestClient, session, rendered):
+    add_posts(session, 5)
+
+    # Newest first; the extra row fetched only signals that a next page exists
+    assert get_page(client, rendered, 1, 2) == (["post-4", "post-3"], True)
+    assert get_page(client, rendered, 2, 2) == (["post-2", "post-1"], True)
+    assert rendered[-1]["has_prev_page"] is True
+
+
+def test_get_posts_last_page(client: TestClient, session, rendered):
+    add_posts(session, 5)
+
+    assert get_page(client, rendered, 3, 2) == (["post-0"], False)
+    assert get_page(client, rendered, 4, 2) == ([], False)
+
+
+def test_get_posts_exact_multiple_of_per_page(client: TestClient, session, rendered):
+    add_posts(session, 4)
+
+    assert get_page(client, rendered, 1, 2) == (["post-3", "post-2"], True)
+    # A full final page must not advertise an empty page after it
+    assert get_page(client, rendered, 2, 2) == (["post-1", "post-0"], False)
+
+
+class _UTCDateTime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return datetime.now(tz or timezone.utc)
+
+
+@pytest.fixture(name="render_calls")
+def render_calls_fixture(monkeypatch):
+    """Count markdown renders done by save_post."""
+    calls = []
+    real_render = posts_utils.render_markdown
+
+    def counting_render(content):
+        calls.append(content)
+        return real_render(content)
+
+    monkeypatch.setattr(posts_utils, "render_markdown", counting_render)
+    # The DB only accepts timezone-aware timestamps
+    monkeypatch.setattr(posts_utils, "datetime", _UTCDateTime)
+    return calls
+
+
+def test_save_post_metadata_edit_skips_render(session, render_calls):
+    post = posts_utils.save_post(session, "Title", "Some *markdown*.", "admin")
+    render_calls.clear()
+    html, excerpt = post.content_html, post.excerpt
+
+    post = posts_utils.save_post(
+        session, "Title", "Some *markdown*.", "admin",
+        tags="a,b", published=True, existing_post=post,
+    )
+
+    assert render_calls == []
+    assert (post.content_html, post.excerpt) == (html, excerpt)
+    assert post.tags == "a,b"
+
+
+def test_save_post_content_edit_rerenders(session, render_calls):
+    post = posts_utils.save_post(session, "Title", "Some *markdown*.", "admin")
+    render_calls.clear()
+
+    post = posts_utils.save_post(session, "Title", "New **content**.", "admin", existing_post=post)
+
+    assert render_calls == ["New **content**."]
+    assert "<strong>content</strong>" in post.content_html
@@ -0,0 +1,55 @@
+import asyncio
+
+from aethera.dreams.presence import ViewerPresenceTracker
+
+
+def test_api_activity_rearms_shutdown_at_deadline():
+    async def run():
+        stops = []
+
+        async def on_should_stop():
+            stops.append(asyncio.get_running_loop().time())
+
+        tracker = ViewerPresenceTracker(api_timeout=0.2, on_should_stop=on_should_stop)
+        tracker.set_gpu_running(True)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        tracker.on_api_access(trigger_gpu_start=False)
+        await asyncio.sleep(0.1)
+        # Extends the activity window to ~0.3s; the pending timer is kept
+        tracker.on_api_access(trigger_gpu_start=False)
+
+        # First timer fires at ~0.2s, sees recent activity and re-arms
+        await asyncio.sleep(0.15)
+        assert stops == []
+        assert tracker.get_status()["shutdown_pending"]
+
+        await asyncio.sleep(0.2)
+        assert len(stops) == 1
+        assert stops[0] - started >= 0.3
+        assert not tracker.get_status()["shutdown_pending"]
+
+    asyncio.run(run())
+
+
+def test_viewer_connect_cancels_pending_shutdown():
+    async def run():
+        stops = []
+
+        async def on_should_stop():
+            stops.append(True)
+
+        tracker = ViewerPresenceTracker(shutdown_delay=0.05, on_should_stop=on_should_stop)
+        tracker.set_gpu_running(True)
+        viewer = object()
+
+        await tracker.on_viewer_connect(viewer)
+        await tracker.on_viewer_disconnect(viewer)
+        assert tracker.get_status()["shutdown_pending"]
+
+        await tracker.on_viewer_connect(viewer)
+        await asyncio.sleep(0.1)
+        assert stops == []
+
+    asyncio.run(run())
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+
+import pytest
+
+from aethera.dreams import state_storage
+
+
+@pytest.fixture(name="state_dir")
+def state_dir_fixture(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_storage, "STATE_DIR", tmp_path)
+    monkeypatch.setattr(state_storage, "STATE_FILE", tmp_path / "last_state.msgpack")
+    monkeypatch.setattr(state_storage, "_pending_state", None)
+    monkeypatch.setattr(state_storage, "_pending_result", None)
+    monkeypatch.setattr(state_storage, "_pending_durable", False)
+    monkeypatch.setattr(state_storage, "_writer_task", None)
+    return tmp_path
+
+
+def test_overlapping_saves_write_only_latest(state_dir, monkeypatch):
+    written = []
+    first_write_started = threading.Event()
+    release_first_write = threading.Event()
+    real_write_state = state_storage._write_state
+
+    def gated_write_state(state_bytes, *args):
+        written.append(bytes(state_bytes))
+        if len(written) == 1:
+            first_write_started.set()
+            release_first_write.wait(timeout=5)
+        return real_write_state(state_bytes, *args)
+
+    monkeypatch.setattr(state_storage, "_write_state", gated_write_state)
+
+    async def run():
+        first = asyncio.create_task(state_storage.save_state(b"snapshot-1"))
+        await asyncio.to_thread(first_write_started.wait, 5)
+
+        # Both arrive while snapshot-1 is still being written
+        second = asyncio.create_task(state_storage.save_state(b"snapshot-2"))
+        third = asyncio.create_task(state_storage.save_state(b"snapshot-3"))
+        await asyncio.sleep(0)
+        release_first_write.set()
+
+        return await asyncio.gather(first, second, third)
+
+    results = asyncio.run(run())
+
+    assert results == [True, True, True]
+    assert written == [b"snapshot-1", b"snapshot-3"]
+    assert state_storage.STATE_FILE.read_bytes() == b"snapshot-3"
+
+
+def test_atomic_write_renames_complete_temp_file(state_dir, monkeypatch):
+    target = state_dir / "last_state.msgpack"
+    target.write_bytes(b"old")
+    real_replace = state_storage.os.replace
+    seen = {}
+
+    def observing_replace(src, dst):
+        # At rename time the temp file is complete and the target untouched
+        seen["temp"] = open(src, "rb").read()
+        seen["target"] = open(dst, "rb").read()
+        real_replace(src, dst)
+
+    monkeypatch.setattr(state_storage.os, "replace", observing_replace)
+
+    state_storage._atomic_write(target, b"new contents")
+
+    assert seen == {"temp": b"new contents", "target": b"old"}
+    assert target.read_bytes() == b"new contents"
+    assert not target.with_suffix(".tmp").exists()
+
+
+@pytest.mark.parametrize("durable, expected_fsyncs", [(False, 0), (True, 2)])
+def test_atomic_write_fsyncs_only_when_durable(state_dir, monkeypatch, durable, expected_fsyncs):
+    fsyncs = []
+    real_fsync = state_storage.os.fsync
+
+    def counting_fsync(fd):
+        fsyncs.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(state_storage.os, "fsync", counting_fsync)
+
+    state_storage._atomic_write(state_dir / "last_state.msgpack", b"data", durable=durable)
+
+    assert len(fsyncs) == expected_fsyncs